@@ -0,0 +1,201 @@
+"""
+Local stand-ins for the dependencies of the order service, used by the benchmark
+harness: a fake User Service (gRPC and HTTP), a stub RabbitMQ publisher, an
+in-memory Redis and JWTs signed with a throwaway RSA key.
+"""
+
+import datetime
+import json
+import threading
+import time
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import grpc
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+
+class TestKeyPair:
+    """
+    RSA key pair generated for one benchmark run, the public key is handed to the
+    service and the private key signs the tokens of the benchmark users
+    """
+
+    def __init__(self):
+        self._private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+        self.public_pem = (
+            self._private_key.public_key()
+            .public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+            .decode()
+        )
+
+    def mint_token(
+        self, role: str, user_id: int, coffee_shop_id: int, branch_id: int = 1
+    ) -> str:
+        """
+        Mint a token carrying the claims expected by src.security.jwt
+        """
+        return jwt.encode(
+            {
+                "sub": f"{role.lower()}{user_id}@bench.local",
+                "role": role,
+                "id": user_id,
+                "coffee_shop_id": coffee_shop_id,
+                "branch_id": branch_id,
+                "exp": datetime.datetime.now(datetime.timezone.utc)
+                + datetime.timedelta(hours=12),
+            },
+            self._private_key,
+            algorithm="RS256",
+        )
+
+
+def start_fake_user_service_grpc(port: int, latency: float = 0.0) -> grpc.Server:
+    """
+    Start an in-process UserService gRPC server built from user_service.proto,
+    every customer is derived from its phone number
+    *Args:
+        port (int): the port to listen on
+        latency (float): artificial delay in seconds added to every call
+    *Returns:
+        the started server
+    """
+    from src.grpc.user_service.protobuf import (
+        user_service_pb2,
+        user_service_pb2_grpc,
+    )
+
+    class FakeUserService(user_service_pb2_grpc.UserServiceServicer):
+        def GetOrCreateCustomer(self, request, context):
+            if latency:
+                time.sleep(latency)
+            return user_service_pb2.CustomerResponseWrapper(
+                customer=user_service_pb2.CustomerResponse(
+                    id=int(request.customer.phone_no),
+                    name=request.customer.name,
+                    phone_no=request.customer.phone_no,
+                    coffee_shop_id=1,
+                ),
+                status_code=200,
+            )
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=16))
+    user_service_pb2_grpc.add_UserServiceServicer_to_server(FakeUserService(), server)
+    server.add_insecure_port(f"127.0.0.1:{port}")
+    server.start()
+    return server
+
+
+def start_fake_user_service_http(
+    port: int, chef_ids: set[int], latency: float = 0.0
+) -> ThreadingHTTPServer:
+    """
+    Start an in-process HTTP server answering GET /users/{user_id} of the
+    User Service, the users in chef_ids are chefs and the others are cashiers
+    *Args:
+        port (int): the port to listen on
+        chef_ids (set[int]): the ids of the users that are chefs
+        latency (float): artificial delay in seconds added to every call
+    *Returns:
+        the started server
+    """
+
+    class FakeUserServiceHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            user_id = int(self.path.rstrip("/").rsplit("/", 1)[-1])
+            body = json.dumps(
+                {
+                    "id": user_id,
+                    "first_name": "bench",
+                    "last_name": str(user_id),
+                    "email": f"user{user_id}@bench.local",
+                    "phone_no": str(user_id),
+                    "role": "CHEF" if user_id in chef_ids else "CASHIER",
+                    "branch_id": 1,
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), FakeUserServiceHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class StubBroker:
+    """
+    Stand-in for the RabbitMQ publisher, it keeps the published messages count
+    instead of sending them to a broker
+    """
+
+    def __init__(self):
+        self.published = 0
+
+    async def connect(self):
+        return None
+
+    async def publish_messages(
+        self, queue_name: str, messages: list[str], message_ids: list[str] = None
+    ):
+        self.published += len(messages)
+
+    async def publish_message(self, queue_name: str, message: str):
+        self.published += 1
+
+    async def close(self):
+        return None
+
+
+def install_stub_broker(broker: StubBroker) -> None:
+    """
+    Replace the methods of the process-wide RabbitMQ client with the stub ones
+    """
+    from src.utils.rabbitmq import rabbitmq_client
+
+    rabbitmq_client.connect = broker.connect
+    rabbitmq_client.publish_messages = broker.publish_messages
+    rabbitmq_client.publish_message = broker.publish_message
+    rabbitmq_client.close = broker.close
+
+
+def install_fake_redis() -> None:
+    """
+    Make the Redis clients and connection pools of the service use an in-memory
+    fakeredis server, must be called before importing the service modules
+    """
+    import fakeredis
+    import redis.asyncio
+    from fakeredis.aioredis import FakeConnection
+
+    server = fakeredis.FakeServer()
+
+    class FakeBlockingConnectionPool(redis.asyncio.BlockingConnectionPool):
+        def __init__(self, **kwargs):
+            super().__init__(connection_class=FakeConnection, server=server, **kwargs)
+
+    class FakeRedis(fakeredis.FakeAsyncRedis):
+        def __init__(self, **kwargs):
+            if "connection_pool" not in kwargs:
+                kwargs["server"] = server
+            super().__init__(**kwargs)
+
+    redis.asyncio.BlockingConnectionPool = FakeBlockingConnectionPool
+    redis.asyncio.Redis = FakeRedis
@@ -0,0 +1,53 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+
+class OrderEventType(Enum):
+    """
+    Enum class to represent the type of an order event
+    """
+
+    CREATED = "order-created"
+    STATUS_CHANGED = "order-status-changed"
+    ASSIGNED = "order-assigned"
+
+
+@dataclass
+class OrderEvent:
+    """
+    Order event dataclass, event_id is set once the event is published
+    """
+
+    event_type: OrderEventType
+    order_id: int
+    coffee_shop_id: int
+    status: Optional[str] = None
+    chef_id: Optional[int] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    event_id: Optional[str] = None
+
+    def to_dict(self):
+        """convert OrderEvent instance to a dictionary with ISO formatted datetime."""
+        return {
+            "event_type": self.event_type.value,
+            "order_id": self.order_id,
+            "coffee_shop_id": self.coffee_shop_id,
+            "status": self.status,
+            "chef_id": self.chef_id,
+            "created_at": self.created_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, event_id: str = None):
+        """build an OrderEvent instance from its dictionary."""
+        return cls(
+            event_type=OrderEventType(data["event_type"]),
+            order_id=data["order_id"],
+            coffee_shop_id=data["coffee_shop_id"],
+            status=data["status"],
+            chef_id=data["chef_id"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            event_id=event_id,
+        )
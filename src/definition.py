@@ -1,9 +1,15 @@
-# UserRole to OrderStatus Mapping
 import grpc
 
+# UserRole to the OrderStatus it can set, each one along with the statuses that the
+# order must have to be changed to it (allowed predecessors)
+ROLE_STATUS_TRANSITIONS = {
+    "CASHIER": {"CLOSED": ["COMPLETED"]},
+    "CHEF": {"IN_PROGRESS": ["PENDING"], "COMPLETED": ["IN_PROGRESS"]},
+}
+
+# UserRole to OrderStatus Mapping
 ROLE_STATUS_MAPPING = {
-    "CASHIER": ["CLOSED"],
-    "CHEF": ["IN_PROGRESS", "COMPLETED"],
+    role: list(transitions) for role, transitions in ROLE_STATUS_TRANSITIONS.items()
 }
 
 
@@ -17,4 +23,6 @@ GRPC_ERROR_MAPPING = {
     grpc.StatusCode.INTERNAL: 500,
     grpc.StatusCode.UNIMPLEMENTED: 501,
     grpc.StatusCode.UNKNOWN: 500,
+    grpc.StatusCode.UNAVAILABLE: 503,
+    grpc.StatusCode.DEADLINE_EXCEEDED: 504,
 }
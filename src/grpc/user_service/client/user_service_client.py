@@ -1,12 +1,56 @@
 import grpc
 from src.grpc.user_service.protobuf import user_service_pb2, user_service_pb2_grpc
 from src.exceptions.exception import OrderServiceException
-from src.settings.settings import USER_SERVICE_GRPC_ADDRESS
+from src.settings.settings import USER_SERVICE_GRPC_ADDRESS, USER_SERVICE_GRPC_SETTINGS
 from src import schemas
 from src.definition import GRPC_ERROR_MAPPING
 
+# shared channel to the User Service, gRPC channels multiplex all the calls
+# over one HTTP/2 connection
+_channel: grpc.aio.Channel = None
+_stub: user_service_pb2_grpc.UserServiceStub = None
 
-def get_or_create_customer_grpc(
+
+def _get_user_service_stub() -> user_service_pb2_grpc.UserServiceStub:
+    """
+    This function returns the stub of the shared User Service channel,
+    the channel is opened on the first call, from the running event loop
+    """
+    global _channel, _stub
+    if _stub is None:
+        _channel = grpc.aio.insecure_channel(
+            USER_SERVICE_GRPC_ADDRESS,
+            options=[
+                (
+                    "grpc.keepalive_time_ms",
+                    USER_SERVICE_GRPC_SETTINGS["KEEPALIVE_TIME_MS"],
+                ),
+                (
+                    "grpc.keepalive_timeout_ms",
+                    USER_SERVICE_GRPC_SETTINGS["KEEPALIVE_TIMEOUT_MS"],
+                ),
+                # ping only while calls are in flight, a gRPC server with the
+                # default settings answers the pings of an idle connection with
+                # GOAWAY too_many_pings
+                ("grpc.keepalive_permit_without_calls", 0),
+            ],
+        )
+        _stub = user_service_pb2_grpc.UserServiceStub(_channel)
+    return _stub
+
+
+async def close_user_service_channel() -> None:
+    """
+    This function closes the shared User Service channel if it is opened
+    """
+    global _channel, _stub
+    if _channel is not None:
+        await _channel.close()
+    _channel = None
+    _stub = None
+
+
+async def get_or_create_customer_grpc(
     token: str, request: schemas.CustomerInPOSTOrderRequestBody
 ) -> schemas.CustomerFullInfo:
     """
@@ -19,23 +63,23 @@ def get_or_create_customer_grpc(
         the created/found Customer instance
     """
     try:
-        with grpc.insecure_channel(USER_SERVICE_GRPC_ADDRESS) as channel:
-            stub = user_service_pb2_grpc.UserServiceStub(channel)
-            response = stub.GetOrCreateCustomer(
-                user_service_pb2.CustomerRequest(
-                    token_data=user_service_pb2.TokenData(token=token),
-                    customer=user_service_pb2.CustomerPOSTRequestBody(
-                        phone_no=request.phone_no, name=request.name
-                    ),
-                )
-            )
-            return schemas.CustomerFullInfo(
-                id=response.customer.id,
-                name=response.customer.name,
-                phone_no=response.customer.phone_no,
-                coffee_shop_id=response.customer.coffee_shop_id,
-                created="2024-09-08 09:59:48.291854",  # Fake date, TODO: Implement this
-            )
+        stub = _get_user_service_stub()
+        response = await stub.GetOrCreateCustomer(
+            user_service_pb2.CustomerRequest(
+                token_data=user_service_pb2.TokenData(token=token),
+                customer=user_service_pb2.CustomerPOSTRequestBody(
+                    phone_no=request.phone_no, name=request.name
+                ),
+            ),
+            timeout=USER_SERVICE_GRPC_SETTINGS["TIMEOUT"],
+        )
+        return schemas.CustomerFullInfo(
+            id=response.customer.id,
+            name=response.customer.name,
+            phone_no=response.customer.phone_no,
+            coffee_shop_id=response.customer.coffee_shop_id,
+            created="2024-09-08 09:59:48.291854",  # Fake date, TODO: Implement this
+        )
     except grpc.RpcError as e:
         status_code = (
             GRPC_ERROR_MAPPING.get(e.code()) if e.code() in GRPC_ERROR_MAPPING else 500
@@ -1,20 +1,33 @@
 from src import schemas
 from src.grpc.user_service.client.user_service_client import get_or_create_customer_grpc
+from src.settings.settings import CUSTOMERS_CACHE_SIZE, CUSTOMERS_CACHE_EXPIRATION
+from src.utils.ttl_cache import TTLCache
 
+# (coffee_shop_id, phone_no) -> schemas.CustomerFullInfo
+customers_cache = TTLCache(maxsize=CUSTOMERS_CACHE_SIZE, ttl=CUSTOMERS_CACHE_EXPIRATION)
 
-def _get_or_create_customer(
+
+async def _get_or_create_customer(
     request: schemas.CustomerInPOSTOrderRequestBody,
+    coffee_shop_id: int,
     auth_token: str,
 ) -> schemas.CustomerFullInfo:
     """
     This helper function used to send an gRPC request to User Management Service
-    to get or create a customer
+    to get or create a customer, returning customers are served from the cache
+    without calling the User Management Service
     *Args:
         request (schemas.CustomerInPOSTOrderRequestBody): contains customer details
+        coffee_shop_id (int): the id of the coffee shop of the customer
         auth_token (str): the token of the user
     *Returns:
         the created/found Customer instance
     """
+    cache_key = (coffee_shop_id, request.phone_no)
+    cached_customer = customers_cache.get(cache_key)
+    if cached_customer:
+        return cached_customer
 
-    response = get_or_create_customer_grpc(token=auth_token, request=request)
+    response = await get_or_create_customer_grpc(token=auth_token, request=request)
+    customers_cache.set(cache_key, response)
     return response
@@ -0,0 +1,133 @@
+import hashlib
+import json
+from typing import Optional
+from fastapi import status
+from pydantic import BaseModel
+from src.exceptions import OrderServiceException
+from src.settings.settings import (
+    IDEMPOTENCY_CACHE_EXPIRATION,
+    IDEMPOTENCY_IN_PROGRESS_EXPIRATION,
+)
+from src.utils.redis_caching import CacheManager
+from src.utils.cache_stats import cache_stats
+
+# marker stored under the key while the first request is being processed
+IN_PROGRESS_MARKER = "IN_PROGRESS"
+
+
+def _hash_request(request: BaseModel) -> str:
+    """
+    This helper function used to hash the body of a request, the hash is stored with
+    the idempotency key to detect the key being reused with another request
+    *Args:
+        request (BaseModel): the body of the request
+    *Returns:
+        the hex digest of the body
+    """
+    return hashlib.sha256(request.model_dump_json().encode()).hexdigest()
+
+
+def _read_stored_response(stored_value: bytes, request_hash: str) -> str:
+    """
+    This helper function used to read the response stored under an idempotency key
+    *Args:
+        stored_value (bytes): the value stored under the key
+        request_hash (str): the hash of the body of the current request
+    *Returns:
+        the stored response, raise OrderServiceException if the key was used with
+        another request body
+    """
+    stored = json.loads(stored_value)
+    if stored["request_hash"] != request_hash:
+        raise OrderServiceException(
+            message="This Idempotency-Key was already used with a different request",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    return stored["response"]
+
+
+async def _claim_idempotency_key(cache_key: str, request_hash: str) -> Optional[str]:
+    """
+    This helper function used to claim an idempotency key before processing a request,
+    the key is marked as in progress only if it was not used before
+    *Args:
+        cache_key (str): the cache key of the idempotency key
+        request_hash (str): the hash of the body of the request
+    *Returns:
+        None if the key is claimed by this request, the stored response of the first
+        request otherwise. Raise OrderServiceException if the first request is still
+        in progress or had another body
+    """
+    cache_manager = CacheManager()
+    try:
+        claimed = await cache_manager.set_cache_if_not_exists(
+            key=cache_key,
+            value=IN_PROGRESS_MARKER,
+            expire=IDEMPOTENCY_IN_PROGRESS_EXPIRATION,
+        )
+        stored_response = None if claimed else await cache_manager.get_cache(cache_key)
+    except Exception as e:
+        # process the request without deduplication if the cache is unavailable
+        print(
+            f"Error while claiming idempotency key: {e}"
+        )  # Will be replaced with logger
+        cache_stats.record(cache_key, "errors")
+        return None
+
+    if claimed:
+        cache_stats.record(cache_key, "misses")
+        return None
+    cache_stats.record(cache_key, "hits")
+    if stored_response is None or stored_response.decode() == IN_PROGRESS_MARKER:
+        raise OrderServiceException(
+            message="A request with this Idempotency-Key is still in progress",
+            status_code=status.HTTP_409_CONFLICT,
+        )
+    return _read_stored_response(
+        stored_value=stored_response, request_hash=request_hash
+    )
+
+
+async def _store_idempotent_response(
+    cache_key: str, request_hash: str, response: str
+) -> None:
+    """
+    This helper function used to store the response of a processed request under its
+    idempotency key along with the hash of its body, so the retries of the request get
+    the same response
+    *Args:
+        cache_key (str): the cache key of the idempotency key
+        request_hash (str): the hash of the body of the request
+        response (str): the serialized response of the request
+    *Returns:
+        None
+    """
+    cache_manager = CacheManager()
+    try:
+        await cache_manager.set_cache(
+            key=cache_key,
+            value=json.dumps({"request_hash": request_hash, "response": response}),
+            expire=IDEMPOTENCY_CACHE_EXPIRATION,
+        )
+    except Exception as e:
+        print(
+            f"Error while storing idempotent response: {e}"
+        )  # Will be replaced with logger
+
+
+async def _release_idempotency_key(cache_key: str) -> None:
+    """
+    This helper function used to release a claimed idempotency key when its request
+    fails, so the request can be retried
+    *Args:
+        cache_key (str): the cache key of the idempotency key
+    *Returns:
+        None
+    """
+    cache_manager = CacheManager()
+    try:
+        await cache_manager.delete_cache(key=cache_key)
+    except Exception as e:
+        print(
+            f"Error while releasing idempotency key: {e}"
+        )  # Will be replaced with logger
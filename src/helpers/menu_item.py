@@ -1,19 +1,20 @@
 from fastapi import status
 from src import schemas, models
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.exceptions.exception import OrderServiceException
 from typing import Optional
 
 
-def create_menu_item(
-    request: schemas.MenuItemPOSTRequestBody, coffee_shop_id: int, db: Session
+async def create_menu_item(
+    request: schemas.MenuItemPOSTRequestBody, coffee_shop_id: int, db: AsyncSession
 ) -> models.MenuItem:
     """
     This helper function will be used to create a new menu item.
     *Args:
         request (schemas.MenuItemPOSTRequestBody): the details of the menu item
         coffee_shop_id (int): the id of the coffee shop to create the menu item for
-        db (Session): the database session
+        db (AsyncSession): the database session
     *Returns:
         the created menu item
     """
@@ -25,31 +26,31 @@ def create_menu_item(
         coffee_shop_id=coffee_shop_id,
     )
     db.add(created_menu_item)
-    db.commit()
-    db.refresh(created_menu_item)
+    await db.commit()
+    await db.refresh(created_menu_item)
     return created_menu_item
 
 
-def _find_menu_item(
-    db: Session,
+async def _find_menu_item(
+    db: AsyncSession,
     menu_item_id: int,
     coffee_shop_id: Optional[int] = None,
 ) -> models.MenuItem:
     """
     This helper function will be used to find a specific menu item by id.
     *Args:
-        db (Session): the database session
+        db (AsyncSession): the database session
         menu_item_id (int): the id of the menu item needed to be found
         coffee_shop_id (Optional[int]): the id of the coffee shop that the item must belongs to
     *Returns:
         the found menu item or raise Exception if not found
     """
-    query = db.query(models.MenuItem).filter(
+    query = select(models.MenuItem).where(
         models.MenuItem.id == menu_item_id, models.MenuItem.deleted == False
     )
     if coffee_shop_id:
-        query = query.filter(models.MenuItem.coffee_shop_id == coffee_shop_id)
-    found_menu_item = query.first()
+        query = query.where(models.MenuItem.coffee_shop_id == coffee_shop_id)
+    found_menu_item = (await db.execute(query)).scalars().first()
     if not found_menu_item:
         raise OrderServiceException(
             message=f"This item with id = {menu_item_id} does not exist",
@@ -58,25 +59,94 @@ def _find_menu_item(
     return found_menu_item
 
 
-def find_all_menu_items(coffee_shop_id: int, db: Session) -> list[models.MenuItem]:
+async def _load_menu_items(
+    db: AsyncSession,
+    menu_item_ids: set[int],
+    coffee_shop_id: int,
+) -> dict[int, models.MenuItem]:
+    """
+    This helper function will be used to load many menu items by their ids in one query.
+    *Args:
+        db (AsyncSession): the database session
+        menu_item_ids (set[int]): the ids of the menu items needed to be loaded
+        coffee_shop_id (int): the id of the coffee shop that the items must belong to
+    *Returns:
+        a dictionary maps each found id to its menu item, ids that are missing, deleted
+        or belong to another shop are not included
+    """
+    query = select(models.MenuItem).where(
+        models.MenuItem.id.in_(menu_item_ids),
+        models.MenuItem.coffee_shop_id == coffee_shop_id,
+        models.MenuItem.deleted == False,
+    )
+    found_menu_items = (await db.execute(query)).scalars().all()
+    return {found_menu_item.id: found_menu_item for found_menu_item in found_menu_items}
+
+
+def _check_menu_items_exist(
+    menu_item_ids: list[int], menu_items_by_id: dict[int, models.MenuItem]
+) -> None:
+    """
+    This helper function will be used to check that all the given ids were loaded.
+    *Args:
+        menu_item_ids (list[int]): the ids of the menu items that must exist
+        menu_items_by_id (dict[int, models.MenuItem]): the loaded menu items
+    *Returns:
+        raise Exception listing all the ids that were not found
+    """
+    missing_ids = sorted(set(menu_item_ids) - menu_items_by_id.keys())
+    if missing_ids:
+        raise OrderServiceException(
+            message=f"These items with ids = {missing_ids} do not exist",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+
+async def _find_menu_items(
+    db: AsyncSession,
+    menu_item_ids: list[int],
+    coffee_shop_id: int,
+) -> dict[int, models.MenuItem]:
+    """
+    This helper function will be used to find many menu items by their ids in one query.
+    *Args:
+        db (AsyncSession): the database session
+        menu_item_ids (list[int]): the ids of the menu items needed to be found
+        coffee_shop_id (int): the id of the coffee shop that the items must belong to
+    *Returns:
+        a dictionary maps each id to its menu item, or raise Exception listing all
+        the ids that were not found (missing, deleted or belong to another shop)
+    """
+    menu_items_by_id = await _load_menu_items(
+        db=db, menu_item_ids=set(menu_item_ids), coffee_shop_id=coffee_shop_id
+    )
+    _check_menu_items_exist(
+        menu_item_ids=menu_item_ids, menu_items_by_id=menu_items_by_id
+    )
+    return menu_items_by_id
+
+
+async def find_all_menu_items(
+    coffee_shop_id: int, db: AsyncSession
+) -> list[models.MenuItem]:
     """
     This helper function will be used to find all menu items in a specific coffee shop.
     *Args:
         coffee_shop_id (int): the id of the coffee shop
-        db (Session): the database session
+        db (AsyncSession): the database session
     *Returns:
         the found inventory items
     """
-    query = db.query(models.MenuItem).filter(
+    query = select(models.MenuItem).where(
         models.MenuItem.deleted == False,
         models.MenuItem.coffee_shop_id == coffee_shop_id,
     )
-    return query.all()
+    return (await db.execute(query)).scalars().all()
 
 
-def update_menu_item(
+async def update_menu_item(
     request: schemas.MenuItemPUTRequestBody,
-    db: Session,
+    db: AsyncSession,
     menu_item_id: int,
     admin_coffee_shop_id: int,
 ):
@@ -84,13 +154,13 @@ def update_menu_item(
     This helper function will be used to update a specific menu item.
     *Args:
         request (schemas.MenuItemPUTRequestBody): the details of the menu item
-        db (Session): the database session
+        db (AsyncSession): the database session
         menu_item_id (int): the id of the menu item to be updated
         admin_coffee_shop_id (int): the id of the coffee shop that the item must belongs to
     *Returns:
         the updated menu item
     """
-    found_menu_item: models.MenuItem = _find_menu_item(
+    found_menu_item: models.MenuItem = await _find_menu_item(
         db=db, menu_item_id=menu_item_id, coffee_shop_id=admin_coffee_shop_id
     )
 
@@ -100,16 +170,18 @@ def update_menu_item(
     )  # Get dictionary of all set fields in request
     for field, value in update_data.items():
         setattr(found_menu_item, field, value)
-    db.commit()
-    db.refresh(found_menu_item)
+    await db.commit()
+    await db.refresh(found_menu_item)
     return found_menu_item
 
 
-def delete_menu_item(db: Session, menu_item_id: int, admin_coffee_shop_id: int) -> None:
+async def delete_menu_item(
+    db: AsyncSession, menu_item_id: int, admin_coffee_shop_id: int
+) -> None:
     """
     This helper function will be used to delete a menu item by id.
     *Args:
-        db (Session): database session
+        db (AsyncSession): database session
         menu_item_id (int): the id of the menu item to be deleted
         admin_coffee_shop_id (int): the id of the coffee shop that the item must belongs to
     *Returns:
@@ -117,9 +189,9 @@ def delete_menu_item(db: Session, menu_item_id: int, admin_coffee_shop_id: int)
     """
 
     # check if the branch belongs to this coffee shop
-    found_menu_item: models.MenuItem = _find_menu_item(
+    found_menu_item: models.MenuItem = await _find_menu_item(
         db=db, menu_item_id=menu_item_id, coffee_shop_id=admin_coffee_shop_id
     )
 
     found_menu_item.deleted = True
-    db.commit()
+    await db.commit()
@@ -0,0 +1,48 @@
+import os
+from src import schemas
+from src.utils.cache_stats import cache_stats
+from src.utils.api_call import get_http_client_stats
+
+
+def get_cache_stats() -> schemas.CacheStatsResponse:
+    """
+    This helper function used to get the hit/miss counters of the cache per key
+    family, the counters are kept in the memory of each worker
+    *Args:
+        None
+    *Returns:
+        CacheStatsResponse that contains the counters of every key family
+    """
+    families = []
+    for family, counters in sorted(cache_stats.snapshot().items()):
+        hits = counters["hits"] + counters["local_hits"] + counters["stale_hits"]
+        lookups = hits + counters["misses"] + counters["errors"]
+        families.append(
+            schemas.CacheFamilyStats(
+                family=family,
+                **counters,
+                hit_ratio=round(hits / lookups, 4) if lookups else 0.0,
+            )
+        )
+    return schemas.CacheStatsResponse(pid=os.getpid(), families=families)
+
+
+def get_http_client_stats_response() -> schemas.HttpClientStatsResponse:
+    """
+    This helper function used to get the counters of the shared HTTP client and the
+    state of the circuit breakers of the downstream hosts, kept in the memory of
+    each worker
+    *Args:
+        None
+    *Returns:
+        HttpClientStatsResponse that contains the counters and the breakers states
+    """
+    stats = get_http_client_stats()
+    return schemas.HttpClientStatsResponse(
+        pid=os.getpid(),
+        **{key: value for key, value in stats.items() if key != "circuit_breakers"},
+        circuit_breakers=[
+            schemas.CircuitBreakerStats(host=host, **breaker_stats)
+            for host, breaker_stats in sorted(stats["circuit_breakers"].items())
+        ],
+    )
@@ -1,113 +1,209 @@
+import asyncio
+import base64
 import datetime
+import uuid
 from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import insert, select, update, func, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from fastapi import status
 from src import schemas, models
 from src.exceptions import OrderServiceException
-from src.helpers import customer, menu_item, user
+from src.helpers import customer, idempotency, menu_item, order_event, outbox, user
 from src.models.order import OrderStatus
 from collections import defaultdict
-from src.definition import ROLE_STATUS_MAPPING
+from src.definition import ROLE_STATUS_MAPPING, ROLE_STATUS_TRANSITIONS
 from src.security.roles import UserRole
-from src.utils.rabbitmq import RabbitMQClient
+from src.utils.outbox_relay import outbox_relay
+from src.settings.database import SessionLocal
 from src.data.notification import Notification
+from src.data.order_event import OrderEvent, OrderEventType
 from src.settings.settings import (
-    RABBITMQ_HOST,
-    RABBITMQ_USER,
-    RABBITMQ_PASSWORD,
-    ORDER_NOTIFICATION_QUEUE,
-    ORDERS_CACHE_KEY,
+    ORDERS_CACHE_FAMILY,
     ORDERS_CACHE_EXPIRATION,
+    ORDERS_CACHE_EARLY_REFRESH_BETA,
+    ORDERS_BATCH_MAX_SIZE,
+    ORDER_DETAILS_CACHE_FAMILY,
+    ORDER_DETAILS_CACHE_EXPIRATION,
+    ORDER_DETAILS_VERSION_CACHE_FAMILY,
+    ORDER_DETAILS_VERSION_EXPIRATION,
+    IDEMPOTENCY_CACHE_FAMILY,
+    ORDER_PLACEMENT_TIMEOUT,
 )
 from src.utils.redis_caching import CacheManager
-from src.utils.json_encoder import DateTimeEncoder
+from src.utils.cache_keys import build_cache_key, cache_key_prefix
+from src.utils.concurrency import run_concurrently
 import json
+from typing import Optional
 
 
-def _validate_order_items(
+def _check_order_not_empty(
     items_list: list[schemas.MenuItemInPOSTOrderRequestBody],
-    coffee_shop_id: int,
-    db: Session,
-):
+) -> None:
     """
-    This helper function used to validate all items in an order that they are exist and the
-    order is not empty
+    This helper function used to check that an order has items
     *Args:
         items_list (list[schemas.MenuItemInPOSTOrderRequestBody]): a list of order items
-        db (Session): a database session
     *Returns:
-        raise an exception if any item is not found
+        raise an exception if the order is empty
     """
     if not items_list:
         raise OrderServiceException(
             status_code=status.HTTP_400_BAD_REQUEST, message="Order items are empty"
         )
-    for item in items_list:
-        menu_item._find_menu_item(
-            db=db, menu_item_id=item.id, coffee_shop_id=coffee_shop_id
-        )
 
 
-def _create_order(
-    customer_id: int,
-    issuer_id: int,
-    db: Session,
-    order_items: list[schemas.MenuItemInPOSTOrderRequestBody],
-) -> models.Order:
+async def _validate_order_items(
+    items_list: list[schemas.MenuItemInPOSTOrderRequestBody],
+    coffee_shop_id: int,
+    db: AsyncSession,
+) -> None:
     """
-    This helper function used to create a new order instance
+    This helper function used to validate all items in an order that they are exist and the
+    order is not empty, all items are loaded using a single query
     *Args:
-        customer_id (int): the customer id
-        issuer_id (int): the issuer id of the order
-        db (Session): a database session
+        items_list (list[schemas.MenuItemInPOSTOrderRequestBody]): a list of order items
+        coffee_shop_id (int): id of the coffee shop that the items must belong to
+        db (AsyncSession): a database session
     *Returns:
-        the created order instance
+        raise an exception if the order is empty or any item is not found
     """
-
-    created_order = models.Order(
-        customer_id=customer_id,
-        issuer_id=issuer_id,
-        status=OrderStatus.PENDING,
-        issue_date=datetime.now(),
+    _check_order_not_empty(items_list=items_list)
+    await menu_item._find_menu_items(
+        db=db,
+        menu_item_ids=[item.id for item in items_list],
+        coffee_shop_id=coffee_shop_id,
     )
-    db.add(created_order)
-    db.commit()
-    db.refresh(created_order)
 
-    # sum quantities of items with the same id
+
+def _aggregate_order_items(
+    order_items: list[schemas.MenuItemInPOSTOrderRequestBody],
+) -> dict[int, int]:
+    """
+    This helper function used to sum the quantities of the items with the same id
+    *Args:
+        order_items (list[schemas.MenuItemInPOSTOrderRequestBody]): the items of the order
+    *Returns:
+        a dictionary maps each item id to its total quantity
+    """
     item_quantities = defaultdict(int)
     for item in order_items:
         item_quantities[item.id] += item.quantity
+    return item_quantities
 
-    # Create order details after aggregation
-    for item_id, total_quantity in item_quantities.items():
-        db.add(
-            models.OrderItem(
-                order_id=created_order.id,
-                item_id=item_id,
-                quantity=total_quantity,  # Use aggregated quantity
+
+async def _create_orders(
+    orders: list[tuple[int, list[schemas.MenuItemInPOSTOrderRequestBody]]],
+    issuer_id: int,
+    coffee_shop_id: int,
+    branch_id: int,
+    db: AsyncSession,
+) -> list[int]:
+    """
+    This helper function used to create many orders along with their items, the orders
+    are inserted using one INSERT ... RETURNING and all of their items are inserted
+    using one multi-row INSERT, nothing is committed so the caller can write the
+    orders in a single transaction
+    *Args:
+        orders (list[tuple[int, list[schemas.MenuItemInPOSTOrderRequestBody]]]): the
+            customer id and the items of each order
+        issuer_id (int): the issuer id of the orders
+        coffee_shop_id (int): the coffee shop id of the orders
+        branch_id (int): the branch id of the issuer
+        db (AsyncSession): a database session
+    *Returns:
+        the ids of the created orders, in the same order of the given orders
+    """
+    issue_date = datetime.now()
+    created_order_ids: list[int] = (
+        (
+            await db.execute(
+                insert(models.Order).returning(
+                    models.Order.id, sort_by_parameter_order=True
+                ),
+                [
+                    {
+                        "customer_id": customer_id,
+                        "issuer_id": issuer_id,
+                        "coffee_shop_id": coffee_shop_id,
+                        "branch_id": branch_id,
+                        "status": OrderStatus.PENDING,
+                        "issue_date": issue_date,
+                    }
+                    for customer_id, _ in orders
+                ],
             )
         )
-    db.commit()  # commit after adding all items
+        .scalars()
+        .all()
+    )
+
+    # Create order details after aggregation
+    await db.execute(
+        insert(models.OrderItem).values(
+            [
+                {
+                    "order_id": created_order_id,
+                    "item_id": item_id,
+                    "quantity": total_quantity,  # Use aggregated quantity
+                }
+                for created_order_id, (_, order_items) in zip(created_order_ids, orders)
+                for item_id, total_quantity in _aggregate_order_items(
+                    order_items=order_items
+                ).items()
+            ]
+        )
+    )
 
-    return created_order
+    return created_order_ids
 
 
-def _create_order_notification(
+async def _create_order(
+    customer_id: int,
+    issuer_id: int,
+    coffee_shop_id: int,
+    branch_id: int,
+    db: AsyncSession,
+    order_items: list[schemas.MenuItemInPOSTOrderRequestBody],
+) -> int:
+    """
+    This helper function used to create a new order instance along with its items,
+    nothing is committed so the caller can write the whole order in a single transaction
+    *Args:
+        customer_id (int): the customer id
+        issuer_id (int): the issuer id of the order
+        coffee_shop_id (int): the coffee shop id of the order
+        branch_id (int): the branch id of the issuer
+        db (AsyncSession): a database session
+        order_items (list[schemas.MenuItemInPOSTOrderRequestBody]): the items of the order
+    *Returns:
+        the id of the created order
+    """
+    (created_order_id,) = await _create_orders(
+        orders=[(customer_id, order_items)],
+        issuer_id=issuer_id,
+        coffee_shop_id=coffee_shop_id,
+        branch_id=branch_id,
+        db=db,
+    )
+    return created_order_id
+
+
+def _build_order_notification(
     order_id: int, issuer_id: int, customer_id: int, coffee_shop_id: int
-):
+) -> Notification:
     """
-    This helper function used to create a new order notification
+    This helper function used to build the notification of a created order
     *Args:
         order_id (int): the order id
         issuer_id (int): the issuer id of the order
         customer_id (int): the customer id of the order
         coffee_shop_id (int): the coffee shop id of the order
     *Returns:
-        None
+        the notification of the order
     """
     message = f"Order with id={order_id} has been created successfully by issuer {issuer_id} for customer {customer_id}"
-    notification = Notification(
+    return Notification(
         order_id=order_id,
         issuer_id=issuer_id,
         customer_id=customer_id,
@@ -115,30 +211,54 @@ def _create_order_notification(
         message=message,
         created_at=datetime.now(),
     )
-    notification = json.dumps(notification.to_dict())
-    (
-        RabbitMQClient(
-            host=RABBITMQ_HOST,
-            username=RABBITMQ_USER,
-            password=RABBITMQ_PASSWORD,
-        ).publish_message(queue_name=ORDER_NOTIFICATION_QUEUE, message=notification)
+
+
+async def _create_order_notification(
+    order_id: int,
+    issuer_id: int,
+    customer_id: int,
+    coffee_shop_id: int,
+    db: AsyncSession,
+):
+    """
+    This helper function used to create a new order notification, the notification is
+    written to the outbox in the same transaction as the order and published to the
+    broker by the outbox relay
+    *Args:
+        order_id (int): the order id
+        issuer_id (int): the issuer id of the order
+        customer_id (int): the customer id of the order
+        coffee_shop_id (int): the coffee shop id of the order
+        db (AsyncSession): a database session
+    *Returns:
+        None
+    """
+    notification = _build_order_notification(
+        order_id=order_id,
+        issuer_id=issuer_id,
+        customer_id=customer_id,
+        coffee_shop_id=coffee_shop_id,
     )
+    await outbox._add_order_notifications(db=db, notifications=[notification])
 
 
-def place_an_order(
+async def _commit_an_order(
     request: schemas.OrderPOSTRequestBody,
     coffee_shop_id: int,
     issuer_id: int,
+    branch_id: int,
     auth_token: str,
-    db: Session,
+    db: AsyncSession,
 ) -> schemas.OrderPOSTResponse:
     """
-    This helper function used to place an order
+    This helper function used to validate, create and commit an order, the order
+    exists once it returns
     *Args:
         request (schemas.OrderPOSTRequestBody): details of the order
         coffee_shop_id (int): id of the coffee shop to create the order for
         issuer_id (int): id of the user (chef or order_receiver) who created the order
-        db (Session): database session
+        branch_id (int): id of the branch of the user who created the order
+        db (AsyncSession): database session
         auth_token (str): the token of the user who created the order (for calling external services)
     *Returns:
         the created order details (schemas.OrderPOSTResponseBody)
@@ -147,62 +267,321 @@ def place_an_order(
     customer_details: schemas.CustomerInPOSTOrderRequestBody = request.customer_details
     order_items: list[schemas.MenuItemInPOSTOrderRequestBody] = request.order_items
 
-    _validate_order_items(items_list=order_items, db=db, coffee_shop_id=coffee_shop_id)
-
-    # Create customer
-    created_customer_instance = customer._get_or_create_customer(
-        request=customer_details,
-        auth_token=auth_token,
+    # validate the items (DB) and create the customer (user service) concurrently,
+    # as neither depends on the other
+    _, created_customer_instance = await run_concurrently(
+        _validate_order_items(
+            items_list=order_items, db=db, coffee_shop_id=coffee_shop_id
+        ),
+        customer._get_or_create_customer(
+            request=customer_details,
+            coffee_shop_id=coffee_shop_id,
+            auth_token=auth_token,
+        ),
+        timeout=ORDER_PLACEMENT_TIMEOUT,
     )
 
-    # Create order and its items
-    created_order = _create_order(
+    # Create order, its items and its notification in a single transaction
+    created_order_id = await _create_order(
         customer_id=created_customer_instance.id,
         issuer_id=issuer_id,
+        coffee_shop_id=coffee_shop_id,
+        branch_id=branch_id,
         db=db,
         order_items=order_items,
     )
-
-    # Create order notification
-    _create_order_notification(
-        order_id=created_order.id,
+    await _create_order_notification(
+        order_id=created_order_id,
         issuer_id=issuer_id,
         customer_id=created_customer_instance.id,
         coffee_shop_id=coffee_shop_id,
+        db=db,
     )
+    await db.commit()
+    outbox_relay.wake()
 
     return schemas.OrderPOSTResponse(
-        id=created_order.id,
+        id=created_order_id,
         customer_phone_no=created_customer_instance.phone_no,
-        status=created_order.status,
+        status=OrderStatus.PENDING,
+    )
+
+
+async def _announce_placed_order(order_id: int, coffee_shop_id: int) -> None:
+    """
+    This helper function used to invalidate the cached orders of the shop and publish
+    the created event of a committed order
+    *Args:
+        order_id (int): the id of the placed order
+        coffee_shop_id (int): the coffee shop id of the order
+    *Returns:
+        None
+    """
+    await _invalidate_orders_cache(coffee_shop_id=coffee_shop_id)
+    await order_event._publish_order_events(
+        events=[
+            OrderEvent(
+                event_type=OrderEventType.CREATED,
+                order_id=order_id,
+                coffee_shop_id=coffee_shop_id,
+                status=OrderStatus.PENDING.value,
+            )
+        ]
     )
 
 
-def find_order(order_id: int, db: Session, coffee_shop_id: int = None) -> models.Order:
+async def place_an_order(
+    request: schemas.OrderPOSTRequestBody,
+    coffee_shop_id: int,
+    issuer_id: int,
+    branch_id: int,
+    auth_token: str,
+    db: AsyncSession,
+    idempotency_key: Optional[str] = None,
+) -> schemas.OrderPOSTResponse:
+    """
+    This helper function used to place an order, when an idempotency key is given,
+    the retries of the same request get the response of the first one without
+    creating the order again, and reusing the key with another request is rejected
+    *Args:
+        request (schemas.OrderPOSTRequestBody): details of the order
+        coffee_shop_id (int): id of the coffee shop to create the order for
+        issuer_id (int): id of the user (chef or order_receiver) who created the order
+        branch_id (int): id of the branch of the user who created the order
+        auth_token (str): the token of the user who created the order (for calling external services)
+        db (AsyncSession): database session
+        idempotency_key (Optional[str]): the key sent by the client to identify the request
+    *Returns:
+        the created order details (schemas.OrderPOSTResponseBody)
+    """
+    cache_key = request_hash = None
+    if idempotency_key:
+        cache_key = build_cache_key(
+            family=IDEMPOTENCY_CACHE_FAMILY,
+            scope=coffee_shop_id,
+            issuer_id=issuer_id,
+            idempotency_key=idempotency_key,
+        )
+        request_hash = idempotency._hash_request(request=request)
+        stored_response = await idempotency._claim_idempotency_key(
+            cache_key=cache_key, request_hash=request_hash
+        )
+        if stored_response is not None:
+            return schemas.OrderPOSTResponse.model_validate_json(stored_response)
+
+    try:
+        placed_order = await _commit_an_order(
+            request=request,
+            coffee_shop_id=coffee_shop_id,
+            issuer_id=issuer_id,
+            branch_id=branch_id,
+            auth_token=auth_token,
+            db=db,
+        )
+    except BaseException:
+        # the order was not committed, let the client retry with the same key
+        if cache_key is not None:
+            await idempotency._release_idempotency_key(cache_key=cache_key)
+        raise
+
+    if cache_key is not None:
+        # the order exists from now on, its response is stored before anything else
+        # can fail (shielded from the cancellation of the request), so a retry never
+        # places it again
+        await asyncio.shield(
+            idempotency._store_idempotent_response(
+                cache_key=cache_key,
+                request_hash=request_hash,
+                response=placed_order.model_dump_json(),
+            )
+        )
+    await _announce_placed_order(
+        order_id=placed_order.id, coffee_shop_id=coffee_shop_id
+    )
+    return placed_order
+
+
+def _order_batch_error(index: int, error: OrderServiceException):
+    """
+    This helper function used to build the result of a rejected order in a batch
+    *Args:
+        index (int): the index of the order in the batch
+        error (OrderServiceException): the reason of the rejection
+    *Returns:
+        the result of the rejected order (schemas.OrderBatchResult)
+    """
+    return schemas.OrderBatchResult(
+        index=index, status_code=error.status_code, detail=error.message
+    )
+
+
+async def place_orders_batch(
+    request: schemas.OrderBatchPOSTRequestBody,
+    coffee_shop_id: int,
+    issuer_id: int,
+    branch_id: int,
+    auth_token: str,
+    db: AsyncSession,
+) -> schemas.OrderBatchPOSTResponse:
+    """
+    This helper function used to place many orders at once (e.g. replayed by an offline
+    POS terminal). The items of all orders are validated with one query, every distinct
+    customer is resolved once, and the accepted orders, their items and notifications are
+    written with bulk inserts in a single transaction. Invalid orders are rejected
+    individually without failing the whole batch
+    *Args:
+        request (schemas.OrderBatchPOSTRequestBody): details of the orders
+        coffee_shop_id (int): id of the coffee shop to create the orders for
+        issuer_id (int): id of the user who created the orders
+        branch_id (int): id of the branch of the user who created the orders
+        auth_token (str): the token of the user who created the orders (for calling external services)
+        db (AsyncSession): database session
+    *Returns:
+        the result of each order in the same order of the request (schemas.OrderBatchPOSTResponse)
+    """
+    orders: list[schemas.OrderPOSTRequestBody] = request.orders
+    if len(orders) > ORDERS_BATCH_MAX_SIZE:
+        raise OrderServiceException(
+            message=f"A batch can contain at most {ORDERS_BATCH_MAX_SIZE} orders",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    results: dict[int, schemas.OrderBatchResult] = {}
+
+    # validate the items of all orders with one query
+    menu_items_by_id = await menu_item._load_menu_items(
+        db=db,
+        menu_item_ids={
+            item.id for order_request in orders for item in order_request.order_items
+        },
+        coffee_shop_id=coffee_shop_id,
+    )
+    for index, order_request in enumerate(orders):
+        try:
+            _check_order_not_empty(items_list=order_request.order_items)
+            menu_item._check_menu_items_exist(
+                menu_item_ids=[item.id for item in order_request.order_items],
+                menu_items_by_id=menu_items_by_id,
+            )
+        except OrderServiceException as se:
+            results[index] = _order_batch_error(index=index, error=se)
+
+    # resolve every distinct customer once, concurrently
+    customers_details = {
+        order_request.customer_details.phone_no: order_request.customer_details
+        for index, order_request in enumerate(orders)
+        if index not in results
+    }
+    resolved_customers = await asyncio.gather(
+        *(
+            customer._get_or_create_customer(
+                request=customer_details,
+                coffee_shop_id=coffee_shop_id,
+                auth_token=auth_token,
+            )
+            for customer_details in customers_details.values()
+        ),
+        return_exceptions=True,
+    )
+    customers_by_phone_no = dict(zip(customers_details.keys(), resolved_customers))
+    for index, order_request in enumerate(orders):
+        if index in results:
+            continue
+        resolved_customer = customers_by_phone_no[
+            order_request.customer_details.phone_no
+        ]
+        if isinstance(resolved_customer, OrderServiceException):
+            results[index] = _order_batch_error(index=index, error=resolved_customer)
+        elif isinstance(resolved_customer, BaseException):
+            raise resolved_customer
+
+    # create the accepted orders, their items and notifications in a single transaction
+    accepted_orders = [
+        (
+            index,
+            order_request,
+            customers_by_phone_no[order_request.customer_details.phone_no],
+        )
+        for index, order_request in enumerate(orders)
+        if index not in results
+    ]
+    if accepted_orders:
+        created_order_ids = await _create_orders(
+            orders=[
+                (order_customer.id, order_request.order_items)
+                for _, order_request, order_customer in accepted_orders
+            ],
+            issuer_id=issuer_id,
+            coffee_shop_id=coffee_shop_id,
+            branch_id=branch_id,
+            db=db,
+        )
+        await outbox._add_order_notifications(
+            db=db,
+            notifications=[
+                _build_order_notification(
+                    order_id=created_order_id,
+                    issuer_id=issuer_id,
+                    customer_id=order_customer.id,
+                    coffee_shop_id=coffee_shop_id,
+                )
+                for created_order_id, (_, _, order_customer) in zip(
+                    created_order_ids, accepted_orders
+                )
+            ],
+        )
+        await db.commit()
+        outbox_relay.wake()
+        await _invalidate_orders_cache(coffee_shop_id=coffee_shop_id)
+        await order_event._publish_order_events(
+            events=[
+                OrderEvent(
+                    event_type=OrderEventType.CREATED,
+                    order_id=created_order_id,
+                    coffee_shop_id=coffee_shop_id,
+                    status=OrderStatus.PENDING.value,
+                )
+                for created_order_id in created_order_ids
+            ]
+        )
+
+        for created_order_id, (index, _, order_customer) in zip(
+            created_order_ids, accepted_orders
+        ):
+            results[index] = schemas.OrderBatchResult(
+                index=index,
+                status_code=status.HTTP_201_CREATED,
+                order=schemas.OrderPOSTResponse(
+                    id=created_order_id,
+                    customer_phone_no=order_customer.phone_no,
+                    status=OrderStatus.PENDING,
+                ),
+            )
+
+    return schemas.OrderBatchPOSTResponse(
+        results=[results[index] for index in range(len(orders))]
+    )
+
+
+async def find_order(
+    order_id: int, db: AsyncSession, coffee_shop_id: int = None
+) -> models.Order:
     """
     This helper function used to find a specific order
     *Args:
         order_id (int): the order id needed to be found
-        db (Session): a database session
+        db (AsyncSession): a database session
         coffee_shop_id (int): id of the coffee shop to find the order for
     *Returns:
         the found order if it exists, raise OrderServiceException otherwise
     """
     query = (
-        db.query(models.Order)
+        select(models.Order)
         .options(joinedload(models.Order.items))
-        .filter(models.Order.id == order_id)
+        .where(models.Order.id == order_id)
     )
     if coffee_shop_id:
-        query = (
-            query.join(models.OrderItem)
-            .join(models.MenuItem)
-            .filter(
-                models.MenuItem.coffee_shop_id == coffee_shop_id,
-                models.OrderItem.item_id == models.MenuItem.id,
-            )
-        )
-    found_order = query.first()
+        query = query.where(models.Order.coffee_shop_id == coffee_shop_id)
+    found_order = (await db.execute(query)).unique().scalars().first()
     if not found_order:
         raise OrderServiceException(
             message=f"This order with id ={order_id} does not exist",
@@ -211,166 +590,583 @@ def find_order(order_id: int, db: Session, coffee_shop_id: int = None) -> models
     return found_order
 
 
-def _find_all_orders(
-    db: Session,
+def _order_details_version_key(coffee_shop_id: int, order_id: int) -> str:
+    """
+    This helper function used to build the cache key of the version of an order, the
+    version is replaced on every change of the order
+    *Args:
+        coffee_shop_id (int): id of the coffee shop of the order
+        order_id (int): the order id
+    *Returns:
+        the cache key of the order version
+    """
+    return build_cache_key(
+        family=ORDER_DETAILS_VERSION_CACHE_FAMILY,
+        scope=coffee_shop_id,
+        order_id=order_id,
+    )
+
+
+def _order_details_cache_key(
+    coffee_shop_id: int, order_id: int, version: Optional[bytes]
+) -> str:
+    """
+    This helper function used to build the cache key of the details of an order
+    *Args:
+        coffee_shop_id (int): id of the coffee shop of the order
+        order_id (int): the order id
+        version (Optional[bytes]): the version of the order, None if it never changed
+    *Returns:
+        the cache key of the order details
+    """
+    return build_cache_key(
+        family=ORDER_DETAILS_CACHE_FAMILY,
+        scope=coffee_shop_id,
+        order_id=order_id,
+        version=version.decode() if version else None,
+    )
+
+
+async def get_orders_details(
+    order_ids: list[int], coffee_shop_id: int
+) -> dict[int, bytes]:
+    """
+    This helper function used to get the details of many orders, the details are
+    cached as their JSON body under the version of their order, all the versions and
+    then all the cached details are read in one round-trip each and the missing ones
+    are found with one query. The versions are read before the database, so details
+    read before a change are cached under the version that the change replaces. A
+    database session is opened only when some details are not cached
+    *Args:
+        order_ids (list[int]): the ids of the orders needed to be found
+        coffee_shop_id (int): id of the coffee shop to find the orders for
+    *Returns:
+        the JSON body of the OrderGETResponse of each found order by its id, in the
+        order of the given ids, the orders that do not exist are not returned
+    """
+    order_ids = _check_order_ids_batch(order_ids=order_ids)
+    cache_manager = CacheManager(use_local_cache=True)
+    details: dict[int, bytes] = {}
+    try:
+        versions = await cache_manager.get_many(
+            keys=[
+                _order_details_version_key(
+                    coffee_shop_id=coffee_shop_id, order_id=order_id
+                )
+                for order_id in order_ids
+            ]
+        )
+        cache_keys = {
+            order_id: _order_details_cache_key(
+                coffee_shop_id=coffee_shop_id, order_id=order_id, version=version
+            )
+            for order_id, version in zip(order_ids, versions)
+        }
+        cached_details = await cache_manager.get_many(keys=list(cache_keys.values()))
+        details.update(
+            (order_id, order_details)
+            for order_id, order_details in zip(order_ids, cached_details)
+            if order_details is not None
+        )
+        cache_available = True
+    except Exception as e:
+        print(f"Error while reading from cache: {e}")  # Will be replaced with logger
+        cache_available = False
+
+    missing_ids = [order_id for order_id in order_ids if order_id not in details]
+    if missing_ids:
+        async with SessionLocal() as db:
+            found_orders = (
+                (
+                    await db.execute(
+                        select(models.Order)
+                        .options(joinedload(models.Order.items))
+                        .where(
+                            models.Order.id.in_(missing_ids),
+                            models.Order.coffee_shop_id == coffee_shop_id,
+                        )
+                    )
+                )
+                .unique()
+                .scalars()
+                .all()
+            )
+            found_details = {
+                found_order.id: schemas.OrderGETResponse.model_validate(found_order)
+                .model_dump_json()
+                .encode()
+                for found_order in found_orders
+            }
+        details.update(found_details)
+        if cache_available and found_details:
+            try:
+                await cache_manager.set_many(
+                    mapping={
+                        cache_keys[order_id]: order_details
+                        for order_id, order_details in found_details.items()
+                    },
+                    expire=ORDER_DETAILS_CACHE_EXPIRATION,
+                )
+            except Exception as e:
+                print(
+                    f"Error while writing to cache: {e}"
+                )  # Will be replaced with logger
+
+    return {
+        order_id: details[order_id] for order_id in order_ids if order_id in details
+    }
+
+
+async def get_order_details(order_id: int, coffee_shop_id: int) -> bytes:
+    """
+    This helper function used to get the details of a specific order, served from
+    the cache when the order did not change since it was last read
+    *Args:
+        order_id (int): the order id needed to be found
+        coffee_shop_id (int): id of the coffee shop to find the order for
+    *Returns:
+        the JSON body of the OrderGETResponse of the order if it exists, raise
+        OrderServiceException otherwise
+    """
+    details = await get_orders_details(
+        order_ids=[order_id], coffee_shop_id=coffee_shop_id
+    )
+    if order_id not in details:
+        raise OrderServiceException(
+            message=f"This order with id ={order_id} does not exist",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+    return details[order_id]
+
+
+async def _invalidate_order_details_cache(
+    coffee_shop_id: int, order_ids: list[int]
+) -> None:
+    """
+    This helper function used to invalidate the cached details of changed orders, by
+    replacing their versions in Redis and dropping the in-process copies of the
+    versions of all workers
+    *Args:
+        coffee_shop_id (int): id of the coffee shop of the changed orders
+        order_ids (list[int]): the ids of the changed orders
+    *Returns:
+        None
+    """
+    try:
+        await CacheManager().replace_many(
+            mapping={
+                _order_details_version_key(
+                    coffee_shop_id=coffee_shop_id, order_id=order_id
+                ): uuid.uuid4().hex
+                for order_id in order_ids
+            },
+            expire=ORDER_DETAILS_VERSION_EXPIRATION,
+        )
+    except Exception as e:
+        print(f"Error while invalidating cache: {e}")  # Will be replaced with logger
+
+
+def _encode_orders_cursor(last_order: models.Order) -> str:
+    """
+    This helper function used to build the opaque cursor that points after the last
+    order of a page
+    *Args:
+        last_order (models.Order): the last order of the page
+    *Returns:
+        the cursor as a url-safe string
+    """
+    position = json.dumps([last_order.issue_date.isoformat(), last_order.id])
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def _decode_orders_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    This helper function used to read the position pointed by a cursor
+    *Args:
+        cursor (str): the cursor returned with the previous page
+    *Returns:
+        the issue date and the id of the last order of the previous page,
+        raise OrderServiceException if the cursor is invalid
+    """
+    try:
+        issue_date, order_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(issue_date), int(order_id)
+    except (ValueError, TypeError):
+        raise OrderServiceException(
+            message="Invalid cursor", status_code=status.HTTP_400_BAD_REQUEST
+        )
+
+
+async def _find_all_orders(
+    db: AsyncSession,
     coffee_shop_id: int,
     size: int,
     page: int,
     status: list[OrderStatus] = None,
-) -> tuple[list[models.Order], int]:
+    cursor: Optional[str] = None,
+    summary: bool = False,
+) -> tuple[list[models.Order], Optional[int], Optional[str]]:
     """
     This helper function used to find all orders in the coffee_shop with specific status
-    and apply a pagination on the resulted orders
+    and apply a pagination on the resulted orders, newest first. The page is selected
+    by its number (offset) or by the cursor of the previous page (keyset on issue_date
+    and id), the cursor pagination costs the same whatever the position of the page.
+    The page of orders is selected first, without joins, so the limit counts orders,
+    then the items of the page are loaded with one IN query
     *Args:
-        db (Session): a database session
+        db (AsyncSession): a database session
         coffee_shop_id (int): id of the coffee shop to find the orders for
         status (str): the status of the orders to find
         size (int): the maximum number of orders to return
         page (int): the page number, needed to calculate the offset to skip
+        cursor (Optional[str]): the cursor of the previous page, replaces the page number
+        summary (bool): do not load the items of the orders
     *Returns:
         a list of all orders in the coffee_shop within specific page and limit,
-        in addition to the total count of orders in the system
+        in addition to the total count of orders in the system (not counted when
+        paginating by cursor) and the cursor of the next page
     """
 
-    query = db.query(models.Order).options(joinedload(models.Order.items))
+    query = select(models.Order)
     if coffee_shop_id:
-        query = (
-            query.join(models.OrderItem)
-            .join(models.MenuItem)
-            .filter(
-                models.MenuItem.coffee_shop_id == coffee_shop_id,
-                models.OrderItem.item_id == models.MenuItem.id,
-            )
-        )
+        query = query.where(models.Order.coffee_shop_id == coffee_shop_id)
     if status:
-        query = query.filter(models.Order.status.in_(status))
+        query = query.where(models.Order.status.in_(status))
 
-    # total count of orders
-    total_count: int = query.distinct(models.Order.id).count()
+    if cursor:
+        total_count = None
+        last_issue_date, last_id = _decode_orders_cursor(cursor=cursor)
+        query = query.where(
+            tuple_(models.Order.issue_date, models.Order.id)
+            < tuple_(last_issue_date, last_id)
+        )
+    else:
+        # total count of orders
+        total_count: int = (
+            await db.execute(
+                select(func.count()).select_from(
+                    query.with_only_columns(models.Order.id).subquery()
+                )
+            )
+        ).scalar_one()
+        query = query.offset((page - 1) * size)
 
     # apply pagination
-    offset = (page - 1) * size
-    orders = query.offset(offset).limit(size).all()
+    query = query.order_by(
+        models.Order.issue_date.desc(), models.Order.id.desc()
+    ).limit(size)
+    if not summary:
+        query = query.options(selectinload(models.Order.items))
+    orders = (await db.execute(query)).scalars().all()
 
-    return orders, total_count
+    next_cursor = (
+        _encode_orders_cursor(last_order=orders[-1]) if len(orders) == size else None
+    )
+    return orders, total_count, next_cursor
 
 
-def _get_cached_orders(
-    coffee_shop_id: int, page: int, size: int, status: list[OrderStatus]
-) -> dict:
+def _orders_cache_generation_key(coffee_shop_id: int) -> str:
     """
-    This helper function used to get all orders from the cache, All args are used to
-    create a unique key for the cache
+    This helper function used to get the key of the generation of the cached
+    orders of a coffee shop, it shares the prefix of the cached pages
     *Args:
-        coffee_shop_id (int): id of the coffee shop to find the orders for
-        status (str): the status of the orders needed to be retrieved
-        page (int): the page number, needed to calculate the offset to skip
-        size (int): the maximum limit of orders to return in the page
+        coffee_shop_id (int): id of the coffee shop of the orders
     *Returns:
-        a JSON / dictionary contains the cached orders if exists, None otherwise
+        the cache key of the generation
     """
-    cache_manager = CacheManager()
-    cache_key = ORDERS_CACHE_KEY.format(
-        coffee_shop_id=coffee_shop_id, status=status, page=page, size=size
+    return cache_key_prefix(family=ORDERS_CACHE_FAMILY, scope=coffee_shop_id) + (
+        "generation"
     )
+
+
+async def _get_orders_cache_generation(coffee_shop_id: int) -> Optional[int]:
+    """
+    This helper function used to get the current generation of the cached orders
+    of a coffee shop, it is part of the key of every cached page
+    *Args:
+        coffee_shop_id (int): id of the coffee shop of the orders
+    *Returns:
+        the generation of the coffee shop, None if the cache can not be read
+    """
+    cache_manager = CacheManager(use_local_cache=True)
     try:
-        cached_response = cache_manager.get_cache(key=cache_key)
-        if cached_response:
-            print(f"Cache hit for key {cache_key}")  # Will be replaced with logger
-            return json.loads(cached_response)
-        else:
-            print(f"Cache miss for key {cache_key}")  # Will be replaced with logger
+        generation = await cache_manager.get_cache(
+            key=_orders_cache_generation_key(coffee_shop_id=coffee_shop_id)
+        )
+        return int(generation or 0)
     except Exception as e:
         print(f"Error while reading from cache: {e}")  # Will be replaced with logger
-    return None
+        return None
+
+
+async def _invalidate_orders_cache(coffee_shop_id: int) -> None:
+    """
+    This helper function used to invalidate all the cached orders pages of a coffee
+    shop after its orders change, by bumping its generation in Redis and dropping
+    the in-process copies of all workers
+    *Args:
+        coffee_shop_id (int): id of the coffee shop of the changed orders
+    *Returns:
+        None
+    """
+    cache_manager = CacheManager()
+    try:
+        await cache_manager.increment(
+            key=_orders_cache_generation_key(coffee_shop_id=coffee_shop_id)
+        )
+        # drop the generation and the pages held in the memory of every worker
+        await cache_manager.invalidate(
+            prefix=cache_key_prefix(family=ORDERS_CACHE_FAMILY, scope=coffee_shop_id)
+        )
+    except Exception as e:
+        print(f"Error while invalidating cache: {e}")  # Will be replaced with logger
 
 
-def _cache_orders_response(
+def _orders_cache_key(
     coffee_shop_id: int,
+    generation: int,
     status: list[OrderStatus],
-    page: int,
+    page: Optional[int],
     size: int,
-    response: schemas.PaginatedOrderResponse,
-) -> None:
+    cursor: Optional[str],
+    summary: bool = False,
+) -> str:
     """
-    This helper function used to cache the orders response
+    This helper function used to build the cache key of an orders page, All args are
+    used to create a unique key for the cache, the same query gives the same key
+    whatever the order of the statuses and the page number is ignored when paginating
+    by cursor
     *Args:
         coffee_shop_id (int): id of the coffee shop to find the orders for
+        generation (int): the generation of the cached orders of the coffee shop
         status (str): the status of the orders needed to be retrieved
-        page (int): the page number, needed to calculate the offset to skip
+        page (Optional[int]): the page number, needed to calculate the offset to skip
         size (int): the maximum limit of orders to return in the page
-        response (schemas.PaginatedOrderResponse): the response to be cached
+        cursor (Optional[str]): the cursor of the previous page
+        summary (bool): the page is without the items of the orders
     *Returns:
-        None
+        the cache key of the page
     """
-    cache_manager = CacheManager()
-    cache_key = ORDERS_CACHE_KEY.format(
-        coffee_shop_id=coffee_shop_id, status=status, page=page, size=size
+    return build_cache_key(
+        family=ORDERS_CACHE_FAMILY,
+        scope=coffee_shop_id,
+        generation=generation,
+        status=status,
+        page=None if cursor else page,
+        size=size,
+        cursor=cursor,
+        summary=summary,
     )
-    try:
-        cache_manager.set_cache(
-            key=cache_key,
-            value=json.dumps(response.dict(), cls=DateTimeEncoder),
-            expire=ORDERS_CACHE_EXPIRATION,
-        )
-    except Exception as e:
-        print(f"Error while writing to cache: {e}")  # Will be replaced with logger
 
 
-def get_all_orders(
-    status: list[OrderStatus], db: Session, coffee_shop_id: int, page: int, size: int
-) -> schemas.PaginatedOrderResponse:
+async def get_all_orders(
+    status: list[OrderStatus],
+    coffee_shop_id: int,
+    page: int,
+    size: int,
+    cursor: Optional[str] = None,
+    summary: bool = False,
+) -> bytes:
     """
-    This helper function used to get all orders along with their details (paginated)
+    This helper function used to get all orders along with their details (paginated),
+    the pages are cached as their JSON body and a missing or expired page is computed
+    by one request at a time. A database session is opened only to compute a page
     *Args:
         status (str): the status of the orders needed to be retrieved
-        db (Session): a database session
         coffee_shop_id (int): id of the coffee shop to find the orders for
         page (int): the page number, needed to calculate the offset to skip
         size (int): the maximum limit of orders to return in the page
+        cursor (Optional[str]): the cursor of the previous page, replaces the page number
+        summary (bool): return the orders without their items
     *Returns:
-        PaginatedOrderResponse instance contains the orders details
+        the JSON body of the PaginatedOrderResponse (PaginatedOrderSummaryResponse in
+        summary mode) that contains the orders details
     """
+    if cursor:
+        page = None
 
-    cached_response = _get_cached_orders(
-        coffee_shop_id=coffee_shop_id, status=status, page=page, size=size
-    )
+    async def find_orders_page() -> str:
+        async with SessionLocal() as db:
+            all_orders, total_count, next_cursor = await _find_all_orders(
+                db=db,
+                status=status,
+                coffee_shop_id=coffee_shop_id,
+                size=size,
+                page=page,
+                cursor=cursor,
+                summary=summary,
+            )
+        response_schema = (
+            schemas.PaginatedOrderSummaryResponse
+            if summary
+            else schemas.PaginatedOrderResponse
+        )
+        return response_schema(
+            total_count=total_count,
+            page=page,
+            page_size=size,
+            next_cursor=next_cursor,
+            orders=all_orders,
+        ).model_dump_json()
 
-    if cached_response:
-        return schemas.PaginatedOrderResponse(**cached_response)
+    # read before the database, so a page read before a write is cached under
+    # the generation that the write replaces
+    generation = await _get_orders_cache_generation(coffee_shop_id=coffee_shop_id)
+    if generation is None:
+        # the cache can not be read, fetch from database
+        response = (await find_orders_page()).encode()
+    else:
+        response = await CacheManager(use_local_cache=True).get_or_compute(
+            key=_orders_cache_key(
+                coffee_shop_id=coffee_shop_id,
+                generation=generation,
+                status=status,
+                page=page,
+                size=size,
+                cursor=cursor,
+                summary=summary,
+            ),
+            compute=find_orders_page,
+            expire=ORDERS_CACHE_EXPIRATION,
+            early_refresh_beta=ORDERS_CACHE_EARLY_REFRESH_BETA,
+        )
+
+    return response
 
-    # if cache miss or read failed, fetch from database
-    all_orders, total_count = _find_all_orders(
-        db=db, status=status, coffee_shop_id=coffee_shop_id, size=size, page=page
-    )
 
-    response = schemas.PaginatedOrderResponse(
-        total_count=total_count,
-        page=page,
-        page_size=size,
-        orders=all_orders,
+async def _orders_changed(coffee_shop_id: int, events: list[OrderEvent]) -> None:
+    """
+    This helper function used to invalidate the cached orders and order details of
+    changed orders and publish their events, called after the changes are committed
+    *Args:
+        coffee_shop_id (int): id of the coffee shop of the changed orders
+        events (list[OrderEvent]): the events of the changes, one per changed order
+    *Returns:
+        None
+    """
+    await _invalidate_orders_cache(coffee_shop_id=coffee_shop_id)
+    await _invalidate_order_details_cache(
+        coffee_shop_id=coffee_shop_id, order_ids=[event.order_id for event in events]
     )
+    await order_event._publish_order_events(events=events)
 
-    # Cache the response
-    _cache_orders_response(
-        coffee_shop_id=coffee_shop_id,
-        status=status,
-        page=page,
-        size=size,
-        response=response,
+
+def _check_order_ids_batch(order_ids: list[int]) -> list[int]:
+    """
+    This helper function used to check the size of a batch of order ids
+    *Args:
+        order_ids (list[int]): the ids of the orders of the batch
+    *Returns:
+        the ids without duplicates, in their first order, raise
+        OrderServiceException if the batch is empty or too large
+    """
+    order_ids = list(dict.fromkeys(order_ids))
+    if not order_ids:
+        raise OrderServiceException(
+            message="The batch does not contain any order",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    if len(order_ids) > ORDERS_BATCH_MAX_SIZE:
+        raise OrderServiceException(
+            message=f"A batch can contain at most {ORDERS_BATCH_MAX_SIZE} orders",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    return order_ids
+
+
+async def _update_orders(
+    order_ids: list[int],
+    coffee_shop_id: int,
+    db: AsyncSession,
+    allowed_statuses: Optional[list[str]] = None,
+    **values,
+) -> None:
+    """
+    This helper function used to change many orders of a coffee shop with one
+    UPDATE ... WHERE id IN (...) RETURNING, the change is applied to all the orders
+    or to none of them. The condition on the current status is checked by the same
+    statement, so concurrent changes of an order can not overwrite each other
+    *Args:
+        order_ids (list[int]): the ids of the orders needed to be changed
+        coffee_shop_id (int): id of the coffee shop that the orders must belong to
+        db (AsyncSession): a database session
+        allowed_statuses (Optional[list[str]]): the statuses the orders must have to
+            be changed, any status if not given
+        values: the new values of the columns of the orders
+    *Returns:
+        None in case of success (nothing is committed), raise OrderServiceException
+        if any order is not found in the coffee shop (404) or does not have an
+        allowed status (409)
+    """
+    conditions = [
+        models.Order.id.in_(order_ids),
+        models.Order.coffee_shop_id == coffee_shop_id,
+    ]
+    if allowed_statuses is not None:
+        conditions.append(models.Order.status.in_(allowed_statuses))
+    updated_order_ids = set(
+        (
+            await db.execute(
+                update(models.Order)
+                .where(*conditions)
+                .values(**values)
+                .returning(models.Order.id)
+                .execution_options(synchronize_session=False)
+            )
+        )
+        .scalars()
+        .all()
     )
+    missing_order_ids = [
+        order_id for order_id in order_ids if order_id not in updated_order_ids
+    ]
+    if not missing_order_ids:
+        return
 
-    return response
+    # find out why, only when the change is rejected
+    current_statuses: dict[int, OrderStatus] = dict(
+        (
+            await db.execute(
+                select(models.Order.id, models.Order.status).where(
+                    models.Order.id.in_(missing_order_ids),
+                    models.Order.coffee_shop_id == coffee_shop_id,
+                )
+            )
+        ).all()
+    )
+    await db.rollback()
+    not_found_order_ids = [
+        order_id for order_id in missing_order_ids if order_id not in current_statuses
+    ]
+    if len(order_ids) == 1 and not_found_order_ids:
+        raise OrderServiceException(
+            message=f"This order with id ={order_ids[0]} does not exist",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+    if not_found_order_ids:
+        raise OrderServiceException(
+            message=f"These orders do not exist: {not_found_order_ids}",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+    conflicts = ", ".join(
+        f"{order_id} ({current_statuses[order_id].value})"
+        for order_id in missing_order_ids
+    )
+    raise OrderServiceException(
+        message=f"The status of these orders does not allow the change: {conflicts}",
+        status_code=status.HTTP_409_CONFLICT,
+    )
 
 
-def _validate_status_change(new_status: str, user_role: str) -> None:
+def _validate_status_change(new_status: str, user_role: str) -> list[str]:
     """
     This helper function used to validate the change in the status of the order
     *Args:
         new_status (OrderStatus): the new status of the order
         user_role (UserRole): the role of the user who tries to change the statu
     *Returns:
-        raise an OrderServiceException in case of violation
+        the statuses that the order must have to be changed to the new status, raise
+        an OrderServiceException in case of violation
     """
 
     if new_status not in ROLE_STATUS_MAPPING[user_role]:
@@ -378,53 +1174,78 @@ def _validate_status_change(new_status: str, user_role: str) -> None:
             message="Unacceptable change of the status",
             status_code=status.HTTP_400_BAD_REQUEST,
         )
+    return ROLE_STATUS_TRANSITIONS[user_role][new_status]
 
 
-def update_order_status(
+async def update_order_status(
     request: schemas.OrderStatusPATCHRequestBody,
     order_id: int,
     user_role: str,
     coffee_shop_id: int,
-    db: Session,
+    db: AsyncSession,
 ) -> None:
     """
     This helper function used to update an order status, it applies conditions on
     the new status of the order along with the role of the user who
-    tries to change this status
+    tries to change this status, and on the current status of the order. The order
+    is changed with one conditional UPDATE, without loading it
     *Args:
         request (schemas.OrderStatusPATCHRequestBody): the request body which contains the new status
         order_id (int): the order id needed to be changed
         coffee_shop_id (int): id of the coffee shop to find the order for
         user_role (UserRole): the role of the user needs to update the order's status
-        db (Session): a database session
+        db (AsyncSession): a database session
     *Returns:
         None in case of success, raise OrderServiceException in case of any failure
     """
-    found_order = find_order(order_id=order_id, coffee_shop_id=coffee_shop_id, db=db)
-    _validate_status_change(new_status=request.status.value, user_role=user_role)
-    found_order.status = request.status
-    db.commit()
+    allowed_statuses = _validate_status_change(
+        new_status=request.status.value, user_role=user_role
+    )
+    await _update_orders(
+        order_ids=[order_id],
+        coffee_shop_id=coffee_shop_id,
+        db=db,
+        allowed_statuses=allowed_statuses,
+        status=request.status,
+    )
+    await db.commit()
+    await _orders_changed(
+        coffee_shop_id=coffee_shop_id,
+        events=[
+            OrderEvent(
+                event_type=OrderEventType.STATUS_CHANGED,
+                order_id=order_id,
+                coffee_shop_id=coffee_shop_id,
+                status=request.status.value,
+            )
+        ],
+    )
 
 
-def assign_order(
+async def assign_order(
     order_id: int,
     chef_id: int,
     coffee_shop_id: int,
-    db: Session,
+    db: AsyncSession,
     auth_token: str = None,
 ) -> None:
     """
-    This helper function used to assign a specific order to a specific chef
+    This helper function used to assign a specific order to a specific chef, the
+    chef is looked up in the users cache before the User Management Service
     *Args:
         order_id (int): the order id needed to be assigned
         chef_id (int): the chef id needed to be assigned to
         coffee_shop_id(int): the coffee shop id of the user and the order
-        db (Session): a database session
+        db (AsyncSession): a database session
     *Returns:
         None in case of success, raise ShopsAppException in case of any failure
     """
-    found_order = find_order(order_id=order_id, db=db, coffee_shop_id=coffee_shop_id)
-    found_user = user._find_user(user_id=chef_id, auth_token=auth_token)
+    found_order = await find_order(
+        order_id=order_id, db=db, coffee_shop_id=coffee_shop_id
+    )
+    found_user = await user._get_user(
+        user_id=chef_id, coffee_shop_id=coffee_shop_id, auth_token=auth_token
+    )
     if found_user.role != UserRole.CHEF:
         raise OrderServiceException(
             message="The assigner must be a chef",
@@ -432,4 +1253,110 @@ def assign_order(
         )
 
     found_order.assigner_id = found_user.id
-    db.commit()
+    await db.commit()
+    await _orders_changed(
+        coffee_shop_id=coffee_shop_id,
+        events=[
+            OrderEvent(
+                event_type=OrderEventType.ASSIGNED,
+                order_id=order_id,
+                coffee_shop_id=coffee_shop_id,
+                chef_id=found_user.id,
+            )
+        ],
+    )
+
+
+async def update_orders_status(
+    request: schemas.OrdersStatusPATCHRequestBody,
+    user_role: str,
+    coffee_shop_id: int,
+    db: AsyncSession,
+) -> schemas.OrdersPATCHResponse:
+    """
+    This helper function used to update the status of many orders at once, with the
+    same conditions on the new status, the role of the user and the current status
+    of the orders as for one order
+    *Args:
+        request (schemas.OrdersStatusPATCHRequestBody): the request body which contains the order ids and the new status
+        user_role (UserRole): the role of the user needs to update the orders' status
+        coffee_shop_id (int): id of the coffee shop to find the orders for
+        db (AsyncSession): a database session
+    *Returns:
+        the ids of the updated orders (schemas.OrdersPATCHResponse), raise
+        OrderServiceException in case of any failure, no order is updated then
+    """
+    order_ids = _check_order_ids_batch(order_ids=request.order_ids)
+    allowed_statuses = _validate_status_change(
+        new_status=request.status.value, user_role=user_role
+    )
+    await _update_orders(
+        order_ids=order_ids,
+        coffee_shop_id=coffee_shop_id,
+        db=db,
+        allowed_statuses=allowed_statuses,
+        status=request.status,
+    )
+    await db.commit()
+    await _orders_changed(
+        coffee_shop_id=coffee_shop_id,
+        events=[
+            OrderEvent(
+                event_type=OrderEventType.STATUS_CHANGED,
+                order_id=order_id,
+                coffee_shop_id=coffee_shop_id,
+                status=request.status.value,
+            )
+            for order_id in order_ids
+        ],
+    )
+    return schemas.OrdersPATCHResponse(order_ids=order_ids)
+
+
+async def assign_orders(
+    request: schemas.OrdersAssignPATCHRequestBody,
+    coffee_shop_id: int,
+    db: AsyncSession,
+    auth_token: str = None,
+) -> schemas.OrdersPATCHResponse:
+    """
+    This helper function used to assign many orders to a specific chef at once, the
+    chef is found once for the whole batch
+    *Args:
+        request (schemas.OrdersAssignPATCHRequestBody): the request body which contains the order ids and the chef id
+        coffee_shop_id(int): the coffee shop id of the user and the orders
+        db (AsyncSession): a database session
+        auth_token (str): the token of the user (for calling external services)
+    *Returns:
+        the ids of the assigned orders (schemas.OrdersPATCHResponse), raise
+        OrderServiceException in case of any failure, no order is assigned then
+    """
+    order_ids = _check_order_ids_batch(order_ids=request.order_ids)
+    found_user = await user._get_user(
+        user_id=request.chef_id, coffee_shop_id=coffee_shop_id, auth_token=auth_token
+    )
+    if found_user.role != UserRole.CHEF:
+        raise OrderServiceException(
+            message="The assigner must be a chef",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    await _update_orders(
+        order_ids=order_ids,
+        coffee_shop_id=coffee_shop_id,
+        db=db,
+        assigner_id=found_user.id,
+    )
+    await db.commit()
+    await _orders_changed(
+        coffee_shop_id=coffee_shop_id,
+        events=[
+            OrderEvent(
+                event_type=OrderEventType.ASSIGNED,
+                order_id=order_id,
+                coffee_shop_id=coffee_shop_id,
+                chef_id=found_user.id,
+            )
+            for order_id in order_ids
+        ],
+    )
+    return schemas.OrdersPATCHResponse(order_ids=order_ids)
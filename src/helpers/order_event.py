@@ -0,0 +1,68 @@
+import json
+from typing import AsyncIterator, Optional
+from fastapi import status
+from src.data.order_event import OrderEvent
+from src.exceptions import OrderServiceException
+from src.utils.order_events import order_events_broker, stream_position
+
+
+async def _publish_order_events(events: list[OrderEvent]) -> None:
+    """
+    This helper function used to publish the events of changed orders to the
+    subscribers of their coffee shops, called after the changes are committed. The
+    events are best effort, the screens that miss one still get the order on their
+    next reload
+    *Args:
+        events (list[OrderEvent]): the events to publish
+    *Returns:
+        None
+    """
+    try:
+        await order_events_broker.publish(events=events)
+    except Exception as e:
+        print(
+            f"Error while publishing order events: {e}"
+        )  # Will be replaced with logger
+
+
+async def _format_order_events(
+    coffee_shop_id: int, last_event_id: Optional[str]
+) -> AsyncIterator[str]:
+    async for event in order_events_broker.subscribe(
+        coffee_shop_id=coffee_shop_id, last_event_id=last_event_id
+    ):
+        if event is None:
+            yield ": keepalive\n\n"
+            continue
+        yield (
+            f"id: {event.event_id}\n"
+            f"event: {event.event_type.value}\n"
+            f"data: {json.dumps(event.to_dict())}\n\n"
+        )
+
+
+def stream_order_events(
+    coffee_shop_id: int, last_event_id: Optional[str] = None
+) -> AsyncIterator[str]:
+    """
+    This helper function used to stream the events of the orders of a coffee shop
+    in the Server-Sent Events format
+    *Args:
+        coffee_shop_id (int): id of the coffee shop to stream the events for
+        last_event_id (Optional[str]): id of the last event received by the client,
+            the stream resumes after it
+    *Returns:
+        an async iterator of the Server-Sent Events messages, raise
+        OrderServiceException if last_event_id is not valid
+    """
+    if last_event_id:
+        try:
+            stream_position(last_event_id)
+        except ValueError:
+            raise OrderServiceException(
+                message="Invalid Last-Event-ID",
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+    return _format_order_events(
+        coffee_shop_id=coffee_shop_id, last_event_id=last_event_id
+    )
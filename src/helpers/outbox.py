@@ -0,0 +1,80 @@
+from datetime import datetime
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src import models
+from src.data.notification import Notification
+from src.settings.settings import ORDER_NOTIFICATION_QUEUE
+from src.utils.rabbitmq import rabbitmq_client
+import json
+
+
+async def _add_order_notifications(
+    db: AsyncSession, notifications: list[Notification]
+) -> None:
+    """
+    This helper function used to write order notifications to the outbox using one
+    multi-row INSERT, it does not commit so the notifications are persisted in the
+    same transaction as their orders
+    *Args:
+        db (AsyncSession): a database session
+        notifications (list[Notification]): the notifications of the orders
+    *Returns:
+        None
+    """
+    await db.execute(
+        insert(models.OrderOutbox).values(
+            [
+                {
+                    "order_id": notification.order_id,
+                    "payload": json.dumps(notification.to_dict()),
+                    "created_at": notification.created_at,
+                }
+                for notification in notifications
+            ]
+        )
+    )
+
+
+async def relay_order_notifications(db: AsyncSession, batch_size: int) -> int:
+    """
+    This helper function used to publish a batch of pending order notifications from
+    the outbox to the broker and mark them as sent once the broker confirmed them. Rows
+    are locked with SKIP LOCKED so many relays can drain the outbox concurrently. The
+    delivery is at-least-once: a row is published again if marking it as sent fails,
+    so every message carries the outbox row id as its message id for the consumers to
+    drop the duplicates
+    *Args:
+        db (AsyncSession): a database session
+        batch_size (int): the maximum number of notifications to relay
+    *Returns:
+        the number of relayed notifications
+    """
+    query = (
+        select(models.OrderOutbox)
+        .where(models.OrderOutbox.sent_at == None)
+        .order_by(models.OrderOutbox.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    pending_notifications = (await db.execute(query)).scalars().all()
+    if not pending_notifications:
+        await db.rollback()  # release the transaction
+        return 0
+
+    await rabbitmq_client.publish_messages(
+        queue_name=ORDER_NOTIFICATION_QUEUE,
+        messages=[notification.payload for notification in pending_notifications],
+        message_ids=[str(notification.id) for notification in pending_notifications],
+    )
+
+    await db.execute(
+        update(models.OrderOutbox)
+        .where(
+            models.OrderOutbox.id.in_(
+                [notification.id for notification in pending_notifications]
+            )
+        )
+        .values(sent_at=datetime.now())
+    )
+    await db.commit()
+    return len(pending_notifications)
@@ -1,11 +1,11 @@
 from datetime import date
-from sqlalchemy.orm import Session
-from sqlalchemy import func, asc, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, asc, desc, select
 from src import schemas, models
 
 
-def list_customers_orders(
-    db: Session,
+async def list_customers_orders(
+    db: AsyncSession,
     from_date: date,
     to_date: date,
     coffee_shop_id: int,
@@ -15,7 +15,7 @@ def list_customers_orders(
     """
     This helper function lists all customers along with their total orders and total paid amount
     *Args:
-        db (Session): SQLAlchemy Session
+        db (AsyncSession): SQLAlchemy AsyncSession
         coffee_shop_id (int): coffee shop id to filter customers
         order_by (str): field to order by
         sort (str): sort order
@@ -23,7 +23,7 @@ def list_customers_orders(
         list[schemas.CustomerOrderReport]: list of customers along with their total orders or total paid amount
     """
     query = (
-        db.query(
+        select(
             models.Order.customer_id,
             func.coalesce(func.count(func.distinct(models.Order.id)), 0).label(
                 "total_orders"
@@ -35,8 +35,8 @@ def list_customers_orders(
         .select_from(models.Order)
         .outerjoin(models.OrderItem, models.Order.id == models.OrderItem.order_id)
         .join(models.MenuItem, models.OrderItem.item_id == models.MenuItem.id)
-        .filter(
-            models.MenuItem.coffee_shop_id == coffee_shop_id,
+        .where(
+            models.Order.coffee_shop_id == coffee_shop_id,
             models.Order.issue_date >= from_date,
             models.Order.issue_date <= to_date,
         )
@@ -49,11 +49,11 @@ def list_customers_orders(
         else:
             query = query.order_by(order_by)  # default asc
 
-    return query.all()
+    return (await db.execute(query)).all()
 
 
-def list_chefs_orders(
-    db: Session,
+async def list_chefs_orders(
+    db: AsyncSession,
     coffee_shop_id: int,
     from_date: date,
     to_date: date,
@@ -63,7 +63,7 @@ def list_chefs_orders(
     """
     This helper function lists all chefs along with their served orders
     *Args:
-        db (Session): SQLAlchemy Session
+        db (AsyncSession): SQLAlchemy AsyncSession
         coffee_shop_id (int): coffee shop id to filter chefs
         from_date (date): start date to filter orders
         to_date (date): end date to filter orders
@@ -73,17 +73,13 @@ def list_chefs_orders(
         list[schemas.ChefOrderReport]: list of chefs along with their served orders
     """
     query = (
-        db.query(
+        select(
             (models.Order.assigner_id).label("chef_id"),
-            func.coalesce(func.count(func.distinct(models.Order.id)), 0).label(
-                "served_orders"
-            ),
+            func.count(models.Order.id).label("served_orders"),
         )
         .select_from(models.Order)
-        .outerjoin(models.OrderItem, models.Order.id == models.OrderItem.order_id)
-        .join(models.MenuItem, models.OrderItem.item_id == models.MenuItem.id)
-        .filter(
-            models.MenuItem.coffee_shop_id == coffee_shop_id,
+        .where(
+            models.Order.coffee_shop_id == coffee_shop_id,
             models.Order.issue_date >= from_date,
             models.Order.issue_date <= to_date,
             models.Order.assigner_id != None,
@@ -97,11 +93,11 @@ def list_chefs_orders(
         else:
             query = query.order_by(order_by)  # default asc
 
-    return query.all()
+    return (await db.execute(query)).all()
 
 
-def list_issuers_orders(
-    db: Session,
+async def list_issuers_orders(
+    db: AsyncSession,
     coffee_shop_id: int,
     from_date: date,
     to_date: date,
@@ -111,7 +107,7 @@ def list_issuers_orders(
     """
     This helper function lists all issuers along with their issued orders
     *Args:
-        db (Session): SQLAlchemy Session
+        db (AsyncSession): SQLAlchemy AsyncSession
         coffee_shop_id (int): coffee shop id to filter issuers
         from_date (date): start date to filter orders
         to_date (date): end date to filter orders
@@ -121,17 +117,13 @@ def list_issuers_orders(
         list[schemas.IssuerOrderReport]: list of issuers along with their issued orders
     """
     query = (
-        db.query(
+        select(
             (models.Order.issuer_id),
-            func.coalesce(func.count(func.distinct(models.Order.id)), 0).label(
-                "issued_orders"
-            ),
+            func.count(models.Order.id).label("issued_orders"),
         )
         .select_from(models.Order)
-        .outerjoin(models.OrderItem, models.Order.id == models.OrderItem.order_id)
-        .join(models.MenuItem, models.OrderItem.item_id == models.MenuItem.id)
-        .filter(
-            models.MenuItem.coffee_shop_id == coffee_shop_id,
+        .where(
+            models.Order.coffee_shop_id == coffee_shop_id,
             models.Order.issue_date >= from_date,
             models.Order.issue_date <= to_date,
             models.Order.issuer_id != None,
@@ -145,16 +137,16 @@ def list_issuers_orders(
         else:
             query = query.order_by(order_by)  # default asc
 
-    return query.all()
+    return (await db.execute(query)).all()
 
 
-def list_orders_income(
-    db: Session, coffee_shop_id: int, from_date: date, to_date: date
+async def list_orders_income(
+    db: AsyncSession, coffee_shop_id: int, from_date: date, to_date: date
 ) -> schemas.OrderIncomeReport:
     """
     This helper function lists total income from orders along with the number of orders
     *Args:
-        db (Session): SQLAlchemy Session
+        db (AsyncSession): SQLAlchemy AsyncSession
         coffee_shop_id (int): coffee shop id to filter orders
         from_date (date): start date to filter orders
         to_date (date): end date to filter orders
@@ -162,7 +154,7 @@ def list_orders_income(
         OrderIncomeReport: total income from orders along with the number of orders
     """
     query = (
-        db.query(
+        select(
             func.count(func.distinct(models.Order.id)).label("total_orders"),
             func.coalesce(
                 func.sum(models.OrderItem.quantity * models.MenuItem.price), 0
@@ -171,27 +163,31 @@ def list_orders_income(
         .select_from(models.Order)
         .outerjoin(models.OrderItem, models.Order.id == models.OrderItem.order_id)
         .outerjoin(models.MenuItem, models.MenuItem.id == models.OrderItem.item_id)
-        .filter(
-            models.MenuItem.coffee_shop_id == coffee_shop_id,
+        .where(
+            models.Order.coffee_shop_id == coffee_shop_id,
             models.Order.issue_date >= from_date,
             models.Order.issue_date <= to_date,
         )
     )
 
-    result = query.first()
+    result = (await db.execute(query)).first()
     return schemas.OrderIncomeReport(
         total_income=result.total_income,
         total_orders=result.total_orders,
     )
 
 
-def list_top_selling_items(
-    db: Session, coffee_shop_id: int, from_date: date, to_date: date, sort: str = None
+async def list_top_selling_items(
+    db: AsyncSession,
+    coffee_shop_id: int,
+    from_date: date,
+    to_date: date,
+    sort: str = None,
 ) -> schemas.TopSellingItemsReport:
     """
     This helper function lists top selling items along with their total quantity
     *Args:
-        db (Session): SQLAlchemy Session
+        db (AsyncSession): SQLAlchemy AsyncSession
         coffee_shop_id (int): coffee shop id to filter items
         from_date (date): start date to filter orders
         to_date (date): end date to filter orders
@@ -200,7 +196,7 @@ def list_top_selling_items(
         TopSellingItemsReport: top selling items along with their total quantity
     """
     query = (
-        db.query(
+        select(
             models.MenuItem.id,
             func.array_agg(models.MenuItem.name)[1].label("item_name"),
             func.coalesce(func.sum(models.OrderItem.quantity), 0).label(
@@ -210,8 +206,8 @@ def list_top_selling_items(
         .select_from(models.MenuItem)
         .join(models.OrderItem, models.MenuItem.id == models.OrderItem.item_id)
         .join(models.Order, models.OrderItem.order_id == models.Order.id)
-        .filter(
-            models.MenuItem.coffee_shop_id == coffee_shop_id,
+        .where(
+            models.Order.coffee_shop_id == coffee_shop_id,
             models.Order.issue_date >= from_date,
             models.Order.issue_date <= to_date,
         )
@@ -223,5 +219,5 @@ def list_top_selling_items(
     else:
         query = query.order_by("selling_times")  # default asc
 
-    result = query.all()
+    result = (await db.execute(query)).all()
     return schemas.TopSellingItemsReport(top_selling_items=result)
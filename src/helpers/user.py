@@ -1,9 +1,19 @@
-from src import schemas
-from src.settings.settings import FIND_USER_ENDPOINT
+import asyncio
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from src import schemas, models
+from src.settings.settings import (
+    FIND_USER_ENDPOINT,
+    USERS_CACHE_FAMILY,
+    USERS_CACHE_EXPIRATION,
+    USERS_CACHE_WARM_LIMIT,
+)
 from src.utils.api_call import send_request
+from src.utils.cache_keys import build_cache_key
+from src.utils.redis_caching import CacheManager
 
 
-def _find_user(user_id: int, auth_token: str) -> schemas.UserResponse:
+async def _find_user(user_id: int, auth_token: str) -> schemas.UserResponse:
     """
     This helper function used to send an API request to User Management Service
     to find a user by id
@@ -13,7 +23,7 @@ def _find_user(user_id: int, auth_token: str) -> schemas.UserResponse:
     *Returns:
         the found User instance
     """
-    response = send_request(
+    response = await send_request(
         action="GET",
         url=FIND_USER_ENDPOINT.format(user_id=user_id),
         payload=None,
@@ -22,3 +32,135 @@ def _find_user(user_id: int, auth_token: str) -> schemas.UserResponse:
 
     user_instance = schemas.UserResponse(**response.json())
     return user_instance
+
+
+def _user_cache_key(user_id: int, coffee_shop_id: int) -> str:
+    """
+    This helper function used to build the cache key of a user found for a coffee shop
+    *Args:
+        user_id (int): the id of the user
+        coffee_shop_id (int): id of the coffee shop of the user who looked it up
+    *Returns:
+        the cache key of the user
+    """
+    return build_cache_key(
+        family=USERS_CACHE_FAMILY, scope=coffee_shop_id, user_id=user_id
+    )
+
+
+async def _get_user(
+    user_id: int, coffee_shop_id: int, auth_token: str
+) -> schemas.UserResponse:
+    """
+    This helper function used to find a user by id, the found users are cached so
+    the User Management Service is called only on a miss
+    *Args:
+        user_id (int): the id of the user needed to be found
+        coffee_shop_id (int): id of the coffee shop of the user who looks it up
+        auth_token (str): the token of the user who looks it up
+    *Returns:
+        the found User instance
+    """
+    cache_key = _user_cache_key(user_id=user_id, coffee_shop_id=coffee_shop_id)
+    cache_manager = CacheManager(use_local_cache=True)
+    try:
+        (cached_user,) = await cache_manager.get_many(keys=[cache_key])
+    except Exception as e:
+        print(f"Error while reading from cache: {e}")  # Will be replaced with logger
+        return await _find_user(user_id=user_id, auth_token=auth_token)
+    if cached_user is not None:
+        return schemas.UserResponse.model_validate_json(cached_user)
+
+    found_user = await _find_user(user_id=user_id, auth_token=auth_token)
+    try:
+        await cache_manager.set_cache(
+            key=cache_key,
+            value=found_user.model_dump_json(),
+            expire=USERS_CACHE_EXPIRATION,
+        )
+    except Exception as e:
+        print(f"Error while writing to cache: {e}")  # Will be replaced with logger
+    return found_user
+
+
+async def warm_users_cache(
+    coffee_shop_id: int, auth_token: str, db: AsyncSession
+) -> schemas.UsersCacheWarmResponse:
+    """
+    This helper function used to pre-warm the users cache of a coffee shop with its
+    most recent assigners (chefs), the ones that are not cached yet are found
+    concurrently
+    *Args:
+        coffee_shop_id (int): id of the coffee shop to warm the cache for
+        auth_token (str): the token of the user (for calling external services)
+        db (AsyncSession): a database session
+    *Returns:
+        the number of users added to the cache (schemas.UsersCacheWarmResponse)
+    """
+    user_ids: list[int] = (
+        (
+            await db.execute(
+                select(models.Order.assigner_id)
+                .where(
+                    models.Order.coffee_shop_id == coffee_shop_id,
+                    models.Order.assigner_id.is_not(None),
+                )
+                .group_by(models.Order.assigner_id)
+                .order_by(func.max(models.Order.issue_date).desc())
+                .limit(USERS_CACHE_WARM_LIMIT)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if not user_ids:
+        return schemas.UsersCacheWarmResponse(warmed_users=0)
+
+    cache_keys = {
+        user_id: _user_cache_key(user_id=user_id, coffee_shop_id=coffee_shop_id)
+        for user_id in user_ids
+    }
+    cache_manager = CacheManager(use_local_cache=True)
+    cached_users = await cache_manager.get_many(keys=list(cache_keys.values()))
+    missing_ids = [
+        user_id
+        for user_id, cached_user in zip(user_ids, cached_users)
+        if cached_user is None
+    ]
+    found_users = await asyncio.gather(
+        *(
+            _find_user(user_id=user_id, auth_token=auth_token)
+            for user_id in missing_ids
+        ),
+        return_exceptions=True,
+    )
+    # the users that can not be found are left to be found on demand
+    found_users = [
+        found_user
+        for found_user in found_users
+        if isinstance(found_user, schemas.UserResponse)
+    ]
+    if found_users:
+        await cache_manager.set_many(
+            mapping={
+                cache_keys[found_user.id]: found_user.model_dump_json()
+                for found_user in found_users
+            },
+            expire=USERS_CACHE_EXPIRATION,
+        )
+    return schemas.UsersCacheWarmResponse(warmed_users=len(found_users))
+
+
+async def _invalidate_user_cache(user_id: int, coffee_shop_id: int) -> None:
+    """
+    This helper function used to remove a changed user from the users cache, in
+    Redis and in the memory of all workers
+    *Args:
+        user_id (int): the id of the changed user
+        coffee_shop_id (int): id of the coffee shop of the user
+    *Returns:
+        None, the cache errors are raised so the change can be retried
+    """
+    await CacheManager().invalidate_keys(
+        keys=[_user_cache_key(user_id=user_id, coffee_shop_id=coffee_shop_id)]
+    )
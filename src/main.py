@@ -1,10 +1,53 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from src.routers import menu_item, order, report
+from aio_pika.exceptions import AMQPError
+from src.routers import menu_item, monitoring, order, report, user
 from src.settings.settings import OPENAPI_URL, ROOT_PATH
+from src.settings.database import async_engine
+from src.utils.rabbitmq import rabbitmq_client
+from src.utils.outbox_relay import outbox_relay
+from src.utils.cache_invalidation import cache_invalidation_listener
+from src.utils.order_events import order_events_broker
+from src.utils.user_role_changes import user_role_changes_consumer
+from src.utils.redis_caching import close_cache_connection_pool
+from src.utils.api_call import close_http_client
+from src.grpc.user_service.client.user_service_client import (
+    close_user_service_channel,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the long-lived clients when the application starts and close
+    them when it shuts down
+    """
+    try:
+        await rabbitmq_client.connect()
+    except (AMQPError, OSError) as e:
+        # the publisher re-connects on the first published message,
+        # print will be replaced with logger
+        print(f"Error while connecting to RabbitMQ: {e}")
+    outbox_relay.start()
+    cache_invalidation_listener.start()
+    order_events_broker.start()
+    user_role_changes_consumer.start()
+    yield
+    await user_role_changes_consumer.stop()
+    await order_events_broker.stop()
+    await cache_invalidation_listener.stop()
+    await outbox_relay.stop()
+    await rabbitmq_client.close()
+    await close_user_service_channel()
+    await close_http_client()
+    await close_cache_connection_pool()
+    await async_engine.dispose()
+
 
 app = FastAPI(
     openapi_url=OPENAPI_URL,
     root_path=ROOT_PATH,
+    lifespan=lifespan,
 )
 
 
@@ -12,3 +55,5 @@ app = FastAPI(
 app.include_router(menu_item.router)
 app.include_router(order.router)
 app.include_router(report.router)
+app.include_router(user.router)
+app.include_router(monitoring.router)
@@ -9,6 +9,7 @@ from src.settings.database import Base
 from src.models.order import Order
 from src.models.order_item import OrderItem
 from src.models.menu_item import MenuItem
+from src.models.order_outbox import OrderOutbox
 from src.settings.settings import DATABASE_SETTINGS
 
 # Add the parent directory of 'src' to the system path
@@ -0,0 +1,29 @@
+"""add order issue date index
+
+Revision ID: 5c1e8f0a7d32
+Revises: b0d221f275f0
+Create Date: 2026-10-18 11:02:47.118304
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e8f0a7d32"
+down_revision: Union[str, None] = "b0d221f275f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_order_issue_date_id", "order", ["issue_date", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_order_issue_date_id", table_name="order")
@@ -0,0 +1,65 @@
+"""add order coffee shop and branch
+
+Revision ID: 9a4d7b2c6e15
+Revises: 5c1e8f0a7d32
+Create Date: 2026-10-18 11:41:09.573920
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4d7b2c6e15"
+down_revision: Union[str, None] = "5c1e8f0a7d32"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("order", sa.Column("coffee_shop_id", sa.Integer(), nullable=True))
+    op.add_column("order", sa.Column("branch_id", sa.Integer(), nullable=True))
+
+    # the coffee shop of an existing order is the shop of its items, the branch
+    # of the issuer is only known by the user service so it stays empty
+    op.execute(
+        """
+        UPDATE "order"
+        SET coffee_shop_id = order_shop.coffee_shop_id
+        FROM (
+            SELECT DISTINCT ON (order_item.order_id)
+                order_item.order_id, menu_item.coffee_shop_id
+            FROM order_item
+            JOIN menu_item ON menu_item.id = order_item.item_id
+            ORDER BY order_item.order_id
+        ) AS order_shop
+        WHERE "order".id = order_shop.order_id
+        """
+    )
+
+    op.drop_index("ix_order_issue_date_id", table_name="order")
+    op.create_index(
+        "ix_order_coffee_shop_id_issue_date",
+        "order",
+        ["coffee_shop_id", sa.text("issue_date DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_order_coffee_shop_id_status_issue_date",
+        "order",
+        ["coffee_shop_id", "status", sa.text("issue_date DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_order_coffee_shop_id_status_issue_date", table_name="order")
+    op.drop_index("ix_order_coffee_shop_id_issue_date", table_name="order")
+    op.create_index(
+        "ix_order_issue_date_id", "order", ["issue_date", "id"], unique=False
+    )
+    op.drop_column("order", "branch_id")
+    op.drop_column("order", "coffee_shop_id")
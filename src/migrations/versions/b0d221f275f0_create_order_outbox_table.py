@@ -0,0 +1,52 @@
+"""create order outbox table
+
+Revision ID: b0d221f275f0
+Revises: 44ccea43c977
+Create Date: 2026-10-18 10:30:12.415207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b0d221f275f0"
+down_revision: Union[str, None] = "44ccea43c977"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "order_outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("order_id", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column("sent_at", sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["order_id"],
+            ["order.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("order_id"),
+    )
+    op.create_index(
+        "ix_order_outbox_pending",
+        "order_outbox",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("sent_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_order_outbox_pending",
+        table_name="order_outbox",
+        postgresql_where=sa.text("sent_at IS NULL"),
+    )
+    op.drop_table("order_outbox")
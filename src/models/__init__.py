@@ -1,3 +1,4 @@
 from src.models.menu_item import *
 from src.models.order import *
 from src.models.order_item import *
+from src.models.order_outbox import *
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Integer,
     TIMESTAMP,
     Enum as SQLAlchemyEnum,
+    Index,
 )
 from enum import Enum
 
@@ -38,5 +39,27 @@ class Order(Base):
     issuer_id = Column(Integer, index=True, nullable=False)
     # relationship with users table (employee(chef) who take the order)
     assigner_id = Column(Integer, index=True, nullable=True)
+    # the coffee shop of the order and the branch of its issuer, copied at
+    # placement time so shop queries do not go through the order items
+    # (null only for the legacy orders that have no items)
+    coffee_shop_id = Column(Integer, nullable=True)
+    branch_id = Column(Integer, nullable=True)
     # relationship with order_items table
     items = relationship("OrderItem", back_populates="order")
+
+    # newest-first listing of a shop (keyset pagination), with or without status
+    __table_args__ = (
+        Index(
+            "ix_order_coffee_shop_id_issue_date",
+            coffee_shop_id,
+            issue_date.desc(),
+            id.desc(),
+        ),
+        Index(
+            "ix_order_coffee_shop_id_status_issue_date",
+            coffee_shop_id,
+            status,
+            issue_date.desc(),
+            id.desc(),
+        ),
+    )
@@ -0,0 +1,29 @@
+from datetime import datetime
+from src.settings.database import Base
+from sqlalchemy import Column, Integer, Text, TIMESTAMP, ForeignKey, Index
+
+
+class OrderOutbox(Base):
+    """
+    SQLAlchemy model for the order events outbox, a row is written in the same
+    transaction as its order and relayed to the broker in the background
+    """
+
+    __tablename__ = "order_outbox"
+
+    id = Column(Integer, primary_key=True)
+    # relationship with orders table (one notification per order)
+    order_id = Column(Integer, ForeignKey("order.id"), nullable=False, unique=True)
+    # the serialized notification message
+    payload = Column(Text, nullable=False)
+    created_at = Column(TIMESTAMP, nullable=False, default=datetime.now)
+    # null until the message is published to the broker
+    sent_at = Column(TIMESTAMP, nullable=True)
+
+    __table_args__ = (
+        Index(
+            "ix_order_outbox_pending",
+            "id",
+            postgresql_where=sent_at.is_(None),
+        ),
+    )
@@ -5,7 +5,7 @@ from src.settings.database import get_db
 from src.security.oauth2 import require_role
 from src.helpers import menu_item
 from src.exceptions.exception import OrderServiceException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(
     tags=["Menu Items"],
@@ -14,10 +14,10 @@ router = APIRouter(
 
 
 @router.post("/", response_model=schemas.MenuItemResponse)
-def create_menu_item_endpoint(
+async def create_menu_item_endpoint(
     request: schemas.MenuItemPOSTRequestBody,
     response: Response,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: schemas.TokenData = Depends(require_role([UserRole.ADMIN])),
 ):
     """
@@ -25,7 +25,7 @@ def create_menu_item_endpoint(
     """
     try:
         response.status_code = status.HTTP_201_CREATED
-        created_inventory_item = menu_item.create_menu_item(
+        created_inventory_item = await menu_item.create_menu_item(
             request=request, coffee_shop_id=current_user.coffee_shop_id, db=db
         )
         return created_inventory_item
@@ -38,8 +38,8 @@ def create_menu_item_endpoint(
 
 
 @router.get("/", response_model=list[schemas.MenuItemResponse])
-def get_all_menu_items_endpoint(
-    db: Session = Depends(get_db),
+async def get_all_menu_items_endpoint(
+    db: AsyncSession = Depends(get_db),
     current_user: schemas.TokenData = Depends(
         require_role(
             [UserRole.ADMIN, UserRole.ORDER_RECEIVER, UserRole.CASHIER, UserRole.CHEF]
@@ -50,7 +50,7 @@ def get_all_menu_items_endpoint(
     GET endpoint to get all menu items in the shop
     """
     try:
-        return menu_item.find_all_menu_items(
+        return await menu_item.find_all_menu_items(
             db=db, coffee_shop_id=current_user.coffee_shop_id
         )
     except OrderServiceException as se:
@@ -62,17 +62,17 @@ def get_all_menu_items_endpoint(
 
 
 @router.put("/{menu_item_id}", response_model=schemas.MenuItemResponse)
-def update_menu_item_endpoint(
+async def update_menu_item_endpoint(
     request: schemas.MenuItemPUTRequestBody,
     menu_item_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: schemas.TokenData = Depends(require_role([UserRole.ADMIN])),
 ):
     """
     PUT endpoint to update a specific menu item
     """
     try:
-        return menu_item.update_menu_item(
+        return await menu_item.update_menu_item(
             request=request,
             db=db,
             menu_item_id=menu_item_id,
@@ -87,10 +87,10 @@ def update_menu_item_endpoint(
 
 
 @router.delete("/{menu_item_id}")
-def delete_menu_item_endpoint(
+async def delete_menu_item_endpoint(
     menu_item_id: int,
     response: Response,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: schemas.TokenData = Depends(require_role([UserRole.ADMIN])),
 ):
     """
@@ -98,7 +98,7 @@ def delete_menu_item_endpoint(
     """
     try:
         response.status_code = status.HTTP_204_NO_CONTENT
-        menu_item.delete_menu_item(
+        await menu_item.delete_menu_item(
             menu_item_id=menu_item_id,
             db=db,
             admin_coffee_shop_id=current_user.coffee_shop_id,
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from src import schemas
+from src.security.oauth2 import require_role
+from src.security.roles import UserRole
+from src.exceptions.exception import OrderServiceException
+from src.helpers import monitoring
+
+router = APIRouter(tags=["Monitoring"], prefix="/monitoring")
+
+
+@router.get("/cache-stats", response_model=schemas.CacheStatsResponse)
+async def get_cache_stats_endpoint(
+    current_user: schemas.TokenData = Depends(require_role([UserRole.ADMIN])),
+):
+    """
+    GET endpoint to get the cache hit/miss counters of the worker per key family
+    """
+    try:
+        return monitoring.get_cache_stats()
+    except OrderServiceException as se:
+        raise HTTPException(status_code=se.status_code, detail=se.message)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+
+
+@router.get("/http-client", response_model=schemas.HttpClientStatsResponse)
+async def get_http_client_stats_endpoint(
+    current_user: schemas.TokenData = Depends(require_role([UserRole.ADMIN])),
+):
+    """
+    GET endpoint to get the counters of the HTTP client of the worker and the state
+    of its circuit breakers
+    """
+    try:
+        return monitoring.get_http_client_stats_response()
+    except OrderServiceException as se:
+        raise HTTPException(status_code=se.status_code, detail=se.message)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
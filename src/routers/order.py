@@ -1,12 +1,21 @@
-from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Depends, Response, status, Query
+from typing import Optional, List, Union
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Depends,
+    Response,
+    status,
+    Query,
+    Header,
+)
+from fastapi.responses import StreamingResponse
 from src import schemas
 from src.security.roles import UserRole
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.settings.database import get_db
 from src.exceptions.exception import OrderServiceException
 from src.security.oauth2 import require_role
-from src.helpers import order
+from src.helpers import order, order_event
 from src.models.order import OrderStatus
 
 router = APIRouter(
@@ -16,25 +25,114 @@ router = APIRouter(
 
 
 @router.post("/", response_model=schemas.OrderPOSTResponse)
-def place_an_order_endpoint(
+async def place_an_order_endpoint(
     request: schemas.OrderPOSTRequestBody,
     response: Response,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: schemas.TokenData = Depends(
         require_role([UserRole.ORDER_RECEIVER, UserRole.CASHIER, UserRole.ADMIN])
     ),
+    idempotency_key: Optional[str] = Header(default=None, max_length=255),
 ):
     """
-    POST endpoint to place an order
+    POST endpoint to place an order, retries that send the same Idempotency-Key
+    header get the response of the first request
     """
     try:
         response.status_code = status.HTTP_201_CREATED
-        return order.place_an_order(
+        return await order.place_an_order(
             request=request,
             coffee_shop_id=current_user.coffee_shop_id,
             issuer_id=current_user.id,
+            branch_id=current_user.branch_id,
             db=db,
             auth_token=current_user.token_value,
+            idempotency_key=idempotency_key,
+        )
+    except OrderServiceException as se:
+        raise HTTPException(status_code=se.status_code, detail=se.message)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+
+
+@router.post("/batch", response_model=schemas.OrderBatchPOSTResponse)
+async def place_orders_batch_endpoint(
+    request: schemas.OrderBatchPOSTRequestBody,
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.TokenData = Depends(
+        require_role([UserRole.ORDER_RECEIVER, UserRole.CASHIER, UserRole.ADMIN])
+    ),
+):
+    """
+    POST endpoint to place many orders at once, returns the result of each order
+    """
+    try:
+        return await order.place_orders_batch(
+            request=request,
+            coffee_shop_id=current_user.coffee_shop_id,
+            issuer_id=current_user.id,
+            branch_id=current_user.branch_id,
+            db=db,
+            auth_token=current_user.token_value,
+        )
+    except OrderServiceException as se:
+        raise HTTPException(status_code=se.status_code, detail=se.message)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+
+
+@router.get("/events", response_class=StreamingResponse)
+async def stream_order_events_endpoint(
+    last_event_id: Optional[str] = Header(default=None, max_length=64),
+    current_user: schemas.TokenData = Depends(
+        require_role([UserRole.CHEF, UserRole.CASHIER, UserRole.ADMIN])
+    ),
+):
+    """
+    GET endpoint to stream the events of the orders of the coffee shop as Server-Sent
+    Events (order-created, order-status-changed and order-assigned), a reconnecting
+    client sends the Last-Event-ID header to get the events it missed
+    """
+    try:
+        return StreamingResponse(
+            order_event.stream_order_events(
+                coffee_shop_id=current_user.coffee_shop_id,
+                last_event_id=last_event_id,
+            ),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+    except OrderServiceException as se:
+        raise HTTPException(status_code=se.status_code, detail=se.message)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+
+
+@router.get("/batch", response_model=list[schemas.OrderGETResponse])
+async def get_orders_batch_endpoint(
+    order_ids: List[int] = Query(alias="order_id"),
+    current_user: schemas.TokenData = Depends(
+        require_role([UserRole.CHEF, UserRole.CASHIER, UserRole.ADMIN])
+    ),
+):
+    """
+    GET endpoint to get many orders at once, the orders that do not exist are
+    omitted. The orders are returned as cached, without validating them again
+    """
+    try:
+        details = await order.get_orders_details(
+            order_ids=order_ids,
+            coffee_shop_id=current_user.coffee_shop_id,
+        )
+        return Response(
+            content=b"[" + b",".join(details.values()) + b"]",
+            media_type="application/json",
         )
     except OrderServiceException as se:
         raise HTTPException(status_code=se.status_code, detail=se.message)
@@ -45,21 +143,23 @@ def place_an_order_endpoint(
 
 
 @router.get("/{order_id}", response_model=schemas.OrderGETResponse)
-def get_order_endpoint(
+async def get_order_endpoint(
     order_id: int,
-    db: Session = Depends(get_db),
     current_user: schemas.TokenData = Depends(
         require_role([UserRole.CHEF, UserRole.CASHIER, UserRole.ADMIN])
     ),
 ):
     """
-    GET endpoint to get a specific order
+    GET endpoint to get a specific order, the order is returned as cached, without
+    validating it again
     """
     try:
-        return order.find_order(
-            order_id=order_id,
-            coffee_shop_id=current_user.coffee_shop_id,
-            db=db,
+        return Response(
+            content=await order.get_order_details(
+                order_id=order_id,
+                coffee_shop_id=current_user.coffee_shop_id,
+            ),
+            media_type="application/json",
         )
     except OrderServiceException as se:
         raise HTTPException(status_code=se.status_code, detail=se.message)
@@ -69,26 +169,93 @@ def get_order_endpoint(
         )
 
 
-@router.get("/", response_model=schemas.PaginatedOrderResponse)
-def get_all_orders_endpoint(
+@router.get(
+    "/",
+    response_model=Union[
+        schemas.PaginatedOrderResponse, schemas.PaginatedOrderSummaryResponse
+    ],
+)
+async def get_all_orders_endpoint(
     order_status: Optional[List[OrderStatus]] = Query(default=None),
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(default=None),
+    summary: bool = Query(default=False),
     current_user: schemas.TokenData = Depends(
         require_role([UserRole.CHEF, UserRole.CASHIER, UserRole.ADMIN])
     ),
 ):
     """
-    GET endpoint to get all orders
+    GET endpoint to get all orders, newest first. Pages are selected by their number
+    or by the next_cursor returned with the previous page, summary=true returns the
+    orders without their items. The page is returned as cached, without validating
+    it again
     """
     try:
-        return order.get_all_orders(
-            status=order_status,
+        return Response(
+            content=await order.get_all_orders(
+                status=order_status,
+                coffee_shop_id=current_user.coffee_shop_id,
+                page=page,
+                size=size,
+                cursor=cursor,
+                summary=summary,
+            ),
+            media_type="application/json",
+        )
+    except OrderServiceException as se:
+        raise HTTPException(status_code=se.status_code, detail=se.message)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+
+
+@router.patch("/status", response_model=schemas.OrdersPATCHResponse)
+async def update_orders_status_endpoint(
+    request: schemas.OrdersStatusPATCHRequestBody,
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.TokenData = Depends(
+        require_role([UserRole.CHEF, UserRole.CASHIER])
+    ),
+):
+    """
+    PATCH endpoint to update the status of many orders at once, all of them are
+    updated or none
+    """
+    try:
+        return await order.update_orders_status(
+            request=request,
+            coffee_shop_id=current_user.coffee_shop_id,
             db=db,
+            user_role=current_user.role.value,
+        )
+    except OrderServiceException as se:
+        raise HTTPException(status_code=se.status_code, detail=se.message)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+
+
+@router.patch("/assign", response_model=schemas.OrdersPATCHResponse)
+async def assign_orders_endpoint(
+    request: schemas.OrdersAssignPATCHRequestBody,
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.TokenData = Depends(
+        require_role([UserRole.ADMIN, UserRole.CHEF])
+    ),
+):
+    """
+    PATCH endpoint to assign many orders to a specific user (CHEF) at once, all of
+    them are assigned or none
+    """
+    try:
+        return await order.assign_orders(
+            request=request,
             coffee_shop_id=current_user.coffee_shop_id,
-            page=page,
-            size=size,
+            db=db,
+            auth_token=current_user.token_value,
         )
     except OrderServiceException as se:
         raise HTTPException(status_code=se.status_code, detail=se.message)
@@ -99,10 +266,10 @@ def get_all_orders_endpoint(
 
 
 @router.patch("/{order_id}/status")
-def update_order_status_endpoint(
+async def update_order_status_endpoint(
     request: schemas.OrderStatusPATCHRequestBody,
     order_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: schemas.TokenData = Depends(
         require_role([UserRole.CHEF, UserRole.CASHIER])
     ),
@@ -111,7 +278,7 @@ def update_order_status_endpoint(
     PATCH endpoint to update the status of a specific order
     """
     try:
-        order.update_order_status(
+        await order.update_order_status(
             request=request,
             coffee_shop_id=current_user.coffee_shop_id,
             db=db,
@@ -127,10 +294,10 @@ def update_order_status_endpoint(
 
 
 @router.patch("/{order_id}/assign/{user_id}")
-def assign_order_endpoints(
+async def assign_order_endpoints(
     order_id: int,
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: schemas.TokenData = Depends(
         require_role([UserRole.ADMIN, UserRole.CHEF])
     ),
@@ -139,7 +306,7 @@ def assign_order_endpoints(
     PATCH endpoint to assign a specific order to a specific user (CHEF)
     """
     try:
-        order.assign_order(
+        await order.assign_order(
             order_id=order_id,
             chef_id=user_id,
             coffee_shop_id=current_user.coffee_shop_id,
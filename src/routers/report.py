@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from src import schemas
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.settings.database import get_db
 from src.security.oauth2 import require_role
 from src.security.roles import UserRole
@@ -16,13 +16,13 @@ router = APIRouter(tags=["Reports"], prefix="/reports")
     "/coffee-shops/{coffee_shop_id}/customers-orders",
     response_model=list[schemas.CustomerOrderReport],
 )
-def list_customers_orders_endpoint(
+async def list_customers_orders_endpoint(
     coffee_shop_id: int,
     from_date: date,
     to_date: date,
     order_by: str = Query("total_paid", regex="^(total_paid|total_orders)$"),
     sort: str = Query("desc", regex="^(asc|desc)$"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: schemas.TokenData = Depends(require_role([UserRole.ADMIN])),
 ):
     """
@@ -33,7 +33,7 @@ def list_customers_orders_endpoint(
             user_coffee_shop_id=current_user.coffee_shop_id,
             target_coffee_shop_id=coffee_shop_id,
         )
-        return report.list_customers_orders(
+        return await report.list_customers_orders(
             db=db,
             coffee_shop_id=coffee_shop_id,
             order_by=order_by,
@@ -53,13 +53,13 @@ def list_customers_orders_endpoint(
     "/coffee-shops/{coffee_shop_id}/chefs-orders",
     response_model=list[schemas.ChefOrderReport],
 )
-def list_chefs_orders_endpoint(
+async def list_chefs_orders_endpoint(
     coffee_shop_id: int,
     from_date: date,
     to_date: date,
     order_by: str = Query(None, regex="^(served_orders)$"),
     sort: str = Query(None, regex="^(asc|desc)$"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: schemas.TokenData = Depends(require_role([UserRole.ADMIN])),
 ):
     """
@@ -70,7 +70,7 @@ def list_chefs_orders_endpoint(
             user_coffee_shop_id=current_user.coffee_shop_id,
             target_coffee_shop_id=coffee_shop_id,
         )
-        return report.list_chefs_orders(
+        return await report.list_chefs_orders(
             db=db,
             coffee_shop_id=coffee_shop_id,
             from_date=from_date,
@@ -90,13 +90,13 @@ def list_chefs_orders_endpoint(
     "/coffee-shops/{coffee_shop_id}/issuers-orders",
     response_model=list[schemas.IssuerOrderReport],
 )
-def list_issuers_orders_endpoint(
+async def list_issuers_orders_endpoint(
     coffee_shop_id: int,
     from_date: date,
     to_date: date,
     order_by: str = Query(None, regex="^(issued_orders)$"),
     sort: str = Query(None, regex="^(asc|desc)$"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: schemas.TokenData = Depends(require_role([UserRole.ADMIN])),
 ):
     """
@@ -107,7 +107,7 @@ def list_issuers_orders_endpoint(
             user_coffee_shop_id=current_user.coffee_shop_id,
             target_coffee_shop_id=coffee_shop_id,
         )
-        return report.list_issuers_orders(
+        return await report.list_issuers_orders(
             db=db,
             coffee_shop_id=coffee_shop_id,
             from_date=from_date,
@@ -127,11 +127,11 @@ def list_issuers_orders_endpoint(
     "/coffee-shops/{coffee_shop_id}/orders-income",
     response_model=schemas.OrderIncomeReport,
 )
-def list_orders_income_endpoint(
+async def list_orders_income_endpoint(
     coffee_shop_id: int,
     from_date: date,
     to_date: date,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: schemas.TokenData = Depends(require_role([UserRole.ADMIN])),
 ):
     """
@@ -142,7 +142,7 @@ def list_orders_income_endpoint(
             user_coffee_shop_id=current_user.coffee_shop_id,
             target_coffee_shop_id=coffee_shop_id,
         )
-        return report.list_orders_income(
+        return await report.list_orders_income(
             db=db,
             coffee_shop_id=coffee_shop_id,
             from_date=from_date,
@@ -160,12 +160,12 @@ def list_orders_income_endpoint(
     "/coffee-shops/{coffee_shop_id}/top-selling-items",
     response_model=schemas.TopSellingItemsReport,
 )
-def list_top_selling_items_endpoint(
+async def list_top_selling_items_endpoint(
     coffee_shop_id: int,
     from_date: date,
     to_date: date,
     sort: str = Query(None, regex="^(asc|desc)$"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: schemas.TokenData = Depends(require_role([UserRole.ADMIN])),
 ):
     """
@@ -176,7 +176,7 @@ def list_top_selling_items_endpoint(
             user_coffee_shop_id=current_user.coffee_shop_id,
             target_coffee_shop_id=coffee_shop_id,
         )
-        return report.list_top_selling_items(
+        return await report.list_top_selling_items(
             db=db,
             coffee_shop_id=coffee_shop_id,
             from_date=from_date,
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from src import schemas
+from src.settings.database import get_db
+from src.security.oauth2 import require_role
+from src.security.roles import UserRole
+from src.exceptions.exception import OrderServiceException
+from src.helpers import user
+
+router = APIRouter(tags=["Users"], prefix="/users")
+
+
+@router.post("/cache/warm", response_model=schemas.UsersCacheWarmResponse)
+async def warm_users_cache_endpoint(
+    db: AsyncSession = Depends(get_db),
+    current_user: schemas.TokenData = Depends(require_role([UserRole.ADMIN])),
+):
+    """
+    POST endpoint to pre-warm the users cache of the coffee shop with its most recent
+    chefs
+    """
+    try:
+        return await user.warm_users_cache(
+            coffee_shop_id=current_user.coffee_shop_id,
+            auth_token=current_user.token_value,
+            db=db,
+        )
+    except OrderServiceException as se:
+        raise HTTPException(status_code=se.status_code, detail=se.message)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
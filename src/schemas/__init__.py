@@ -4,3 +4,4 @@ from src.schemas.order import *
 from src.schemas.customer import *
 from src.schemas.user import *
 from src.schemas.report import *
+from src.schemas.monitoring import *
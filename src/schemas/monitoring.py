@@ -0,0 +1,52 @@
+from pydantic import BaseModel
+
+
+class CacheFamilyStats(BaseModel):
+    """
+    pydantic model for the cache lookups of a key family
+    """
+
+    family: str
+    hits: int
+    local_hits: int
+    stale_hits: int
+    misses: int
+    errors: int
+    hit_ratio: float
+
+
+class CacheStatsResponse(BaseModel):
+    """
+    pydantic model for the cache lookups of the worker that served the request
+    """
+
+    pid: int
+    families: list[CacheFamilyStats]
+
+
+class CircuitBreakerStats(BaseModel):
+    """
+    pydantic model for the circuit breaker of a downstream host
+    """
+
+    host: str
+    state: str
+    consecutive_failures: int
+    opened_count: int
+    seconds_in_state: float
+
+
+class HttpClientStatsResponse(BaseModel):
+    """
+    pydantic model for the shared HTTP client of the worker that served the request
+    """
+
+    pid: int
+    requests: int
+    in_flight: int
+    retries: int
+    failures: int
+    rejected: int
+    max_connections: int
+    max_keepalive_connections: int
+    circuit_breakers: list[CircuitBreakerStats]
@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import BaseModel
 from src.schemas.menu_item import (
     MenuItemInPOSTOrderRequestBody,
@@ -27,9 +28,37 @@ class OrderPOSTResponse(BaseModel):
     status: OrderStatus
 
 
-class OrderGETResponse(BaseModel):
+class OrderBatchPOSTRequestBody(BaseModel):
     """
-    pydantic schema for the order in GET response body
+    pydantic schema for many orders in POST batch request body
+    """
+
+    orders: list[OrderPOSTRequestBody]
+
+
+class OrderBatchResult(BaseModel):
+    """
+    pydantic schema for the result of one order in the POST batch response body,
+    contains the created order or the reason of its rejection
+    """
+
+    index: int
+    status_code: int
+    order: Optional[OrderPOSTResponse] = None
+    detail: Optional[str] = None
+
+
+class OrderBatchPOSTResponse(BaseModel):
+    """
+    pydantic schema for the orders in POST batch response body
+    """
+
+    results: list[OrderBatchResult]
+
+
+class OrderSummaryGETResponse(BaseModel):
+    """
+    pydantic schema for the order without its items in GET response body
     """
 
     id: int
@@ -37,27 +66,75 @@ class OrderGETResponse(BaseModel):
     issuer_id: int
     status: str  # OrderStatus
     customer_id: int
-    items: list[MenuItemInGETOrderResponseBody]
 
     class Config:
         orm_mode = True
         from_attributes = True
 
 
+class OrderGETResponse(OrderSummaryGETResponse):
+    """
+    pydantic schema for the order in GET response body
+    """
+
+    items: list[MenuItemInGETOrderResponseBody]
+
+
 class PaginatedOrderResponse(BaseModel):
     """
     pydantic schema for the paginated orders in GET response body
     """
 
-    total_count: int
-    page: int
+    # total_count and page are not set when paginating by cursor
+    total_count: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
+    # pass it as cursor to get the next page, None on the last page
+    next_cursor: Optional[str] = None
     orders: list[OrderGETResponse]
 
 
+class PaginatedOrderSummaryResponse(BaseModel):
+    """
+    pydantic schema for the paginated orders without their items in GET response body
+    """
+
+    total_count: Optional[int] = None
+    page: Optional[int] = None
+    page_size: int
+    next_cursor: Optional[str] = None
+    orders: list[OrderSummaryGETResponse]
+
+
 class OrderStatusPATCHRequestBody(BaseModel):
     """
     pydantic schema for the order Status in PATCH request body
     """
 
     status: OrderStatus
+
+
+class OrdersStatusPATCHRequestBody(BaseModel):
+    """
+    pydantic schema for the orders Status in PATCH request body
+    """
+
+    order_ids: list[int]
+    status: OrderStatus
+
+
+class OrdersAssignPATCHRequestBody(BaseModel):
+    """
+    pydantic schema for the orders assignment in PATCH request body
+    """
+
+    order_ids: list[int]
+    chef_id: int
+
+
+class OrdersPATCHResponse(BaseModel):
+    """
+    pydantic schema for the changed orders in PATCH response body
+    """
+
+    order_ids: list[int]
@@ -18,3 +18,11 @@ class UserResponse(BaseModel):
     class Config:
         orm_mode = True
         from_attributes = True
+
+
+class UsersCacheWarmResponse(BaseModel):
+    """
+    Pydantic schema for the pre-warmed users cache response
+    """
+
+    warmed_users: int
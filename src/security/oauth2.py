@@ -5,7 +5,7 @@ from src.security.roles import UserRole
 from src import schemas
 
 
-def get_token_from_header(request: Request) -> str:
+async def get_token_from_header(request: Request) -> str:
     """
     Extracts the token from the Authorization header.
     """
@@ -19,7 +19,7 @@ def get_token_from_header(request: Request) -> str:
     return auth_header[len("Bearer ") :]
 
 
-def get_current_user(
+async def get_current_user(
     token: Annotated[str, Depends(get_token_from_header)]
 ) -> schemas.TokenData:
     """
@@ -50,7 +50,7 @@ def require_role(allowed_roles: list[UserRole]):
         raise exception otherwise.
     """
 
-    def role_checker(current_user: schemas.TokenData = Depends(get_current_user)):
+    async def role_checker(current_user: schemas.TokenData = Depends(get_current_user)):
         if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
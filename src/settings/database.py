@@ -1,28 +1,36 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from src.settings.settings import DATABASE_SETTINGS
 from sqlalchemy_utils import database_exists, create_database
 
 
-# creating the engine
+# creating the engine (sync, used for creating the database only)
 engine = create_engine(url=DATABASE_SETTINGS["URL"])
 
 # Ensure database exists
 if not database_exists(engine.url):
     create_database(engine.url)
 
-# creating the db session
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# creating the async engine used by the application
+async_engine = create_async_engine(
+    url=DATABASE_SETTINGS["ASYNC_URL"],
+    pool_size=DATABASE_SETTINGS["POOL_SIZE"],
+    max_overflow=DATABASE_SETTINGS["MAX_OVERFLOW"],
+    pool_pre_ping=True,
+)
+
+# creating the db session, objects are not expired on commit since
+# they can't be lazily refreshed on an async session
+SessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
 
 # declare a mapping Base class
 Base = declarative_base()
 
 
 # Dependency to get the database session
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -16,10 +16,15 @@ POSTGRES_DB = os.getenv("POSTGRES_DB")
 SQLALCHEMY_DATABASE_URL = (
     f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{DB_SERVICE}/{POSTGRES_DB}"
 )
+# database url used by the application (async driver)
+SQLALCHEMY_ASYNC_DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{DB_SERVICE}/{POSTGRES_DB}"
 
 # database settings
 DATABASE_SETTINGS = {
     "URL": SQLALCHEMY_DATABASE_URL,
+    "ASYNC_URL": SQLALCHEMY_ASYNC_DATABASE_URL,
+    "POOL_SIZE": int(os.getenv("DB_POOL_SIZE", 10)),
+    "MAX_OVERFLOW": int(os.getenv("DB_MAX_OVERFLOW", 20)),
 }
 
 
@@ -37,6 +42,25 @@ JWT_TOKEN_SETTINGS = {
 USER_SERVICE_BASE_URL = os.getenv("USER_SERVICE_BASE_URL")
 
 
+# shared HTTP client of the calls to the other services
+HTTP_CLIENT_SETTINGS = {
+    "CONNECT_TIMEOUT": float(os.getenv("HTTP_CONNECT_TIMEOUT", 1.0)),  # seconds
+    "READ_TIMEOUT": float(os.getenv("HTTP_READ_TIMEOUT", 3.0)),  # seconds
+    # how long a request waits for a free connection of the pool
+    "POOL_TIMEOUT": float(os.getenv("HTTP_POOL_TIMEOUT", 1.0)),  # seconds
+    "MAX_CONNECTIONS": int(os.getenv("HTTP_MAX_CONNECTIONS", 100)),
+    "MAX_KEEPALIVE_CONNECTIONS": int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20)),
+    "KEEPALIVE_EXPIRY": float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 30)),  # seconds
+    # extra attempts of the GET requests that failed or got a 502/503/504
+    "RETRIES": int(os.getenv("HTTP_RETRIES", 2)),
+    # the n-th retry waits a random time up to RETRY_BACKOFF * 2^(n-1) seconds
+    "RETRY_BACKOFF": float(os.getenv("HTTP_RETRY_BACKOFF", 0.1)),
+    # the calls to a host fail fast for RESET_TIMEOUT seconds after
+    # FAILURE_THRESHOLD consecutive failures, then one trial call is let through
+    "BREAKER_FAILURE_THRESHOLD": int(os.getenv("HTTP_BREAKER_FAILURE_THRESHOLD", 5)),
+    "BREAKER_RESET_TIMEOUT": float(os.getenv("HTTP_BREAKER_RESET_TIMEOUT", 10)),
+}
+
 # USER SERVICE ENDPOINTS
 CUSTOMER_ENDPOINT = USER_SERVICE_BASE_URL + "/customers"
 USER_ENDPOINT = USER_SERVICE_BASE_URL + "/users"
@@ -45,25 +69,127 @@ COFFEE_SHOP_ENDPOINT = USER_SERVICE_BASE_URL + "/coffee-shops"
 
 # RabbitMQ and Notification Service settings
 RABBITMQ_HOST = os.getenv("RABBITMQ_HOST")
-RABBITMQ_USER = os.getenv("RABBITMQ_USER")
-RABBITMQ_PASSWORD = os.getenv("RABBITMQ_PASSWORD")
+RABBITMQ_USER = os.getenv("RABBITMQ_USER", "guest")
+RABBITMQ_PASSWORD = os.getenv("RABBITMQ_PASSWORD", "guest")
 ORDER_NOTIFICATION_QUEUE = os.getenv("ORDER_NOTIFICATION_QUEUE")
 
+# maximum number of orders accepted in one batch request
+ORDERS_BATCH_MAX_SIZE = int(os.getenv("ORDERS_BATCH_MAX_SIZE", 100))
+# deadline in seconds for the independent steps of placing an order
+ORDER_PLACEMENT_TIMEOUT = float(os.getenv("ORDER_PLACEMENT_TIMEOUT", 5.0))
+
+# Order notifications outbox relay settings
+OUTBOX_RELAY_SETTINGS = {
+    "BATCH_SIZE": int(os.getenv("OUTBOX_RELAY_BATCH_SIZE", 100)),
+    "INTERVAL": float(os.getenv("OUTBOX_RELAY_INTERVAL", 1.0)),  # seconds
+}
+
 # Redis and Cache settings
 REDIS = {
     "HOST": os.getenv("REDIS_HOST"),
     "PORT": os.getenv("REDIS_PORT"),
     "DB": os.getenv("REDIS_DB"),
     "PASSWORD": os.getenv("REDIS_PASSWORD"),
+    # process-wide connection pool settings
+    "MAX_CONNECTIONS": int(os.getenv("REDIS_MAX_CONNECTIONS", 50)),
+    "POOL_TIMEOUT": float(os.getenv("REDIS_POOL_TIMEOUT", 1.0)),  # seconds
+    "SOCKET_TIMEOUT": float(os.getenv("REDIS_SOCKET_TIMEOUT", 1.0)),  # seconds
+    "SOCKET_CONNECT_TIMEOUT": float(
+        os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", 1.0)
+    ),  # seconds
 }
 
-ORDERS_CACHE_KEY = "orders:{coffee_shop_id}:{status}:{page}:{size}"
-ORDERS_CACHE_EXPIRATION = 300  # 5 minutes
+# in-process cache tier checked before Redis, its entries are invalidated across
+# the workers through Redis pub/sub and expire after a short TTL in case a
+# message is missed
+LOCAL_CACHE_SETTINGS = {
+    "ENABLED": os.getenv("LOCAL_CACHE_ENABLED", "true").lower() == "true",
+    "SIZE": int(os.getenv("LOCAL_CACHE_SIZE", 1024)),
+    "EXPIRATION": float(os.getenv("LOCAL_CACHE_EXPIRATION", 30)),  # seconds
+}
+CACHE_INVALIDATION_CHANNEL = "cache-invalidation"
+# channel of the single keys removed from the in-process tier of every worker
+CACHE_KEY_INVALIDATION_CHANNEL = "cache-key-invalidation"
+
+# compression of the cached values larger than the threshold (bytes)
+CACHE_COMPRESSION = {
+    "ALGORITHM": os.getenv("CACHE_COMPRESSION", "zlib"),  # "zlib" or "none"
+    "THRESHOLD": int(os.getenv("CACHE_COMPRESSION_THRESHOLD", 1024)),
+    "LEVEL": int(os.getenv("CACHE_COMPRESSION_LEVEL", 1)),
+}
+
+# single-flight recomputation of the cached values
+CACHE_LOCK_SETTINGS = {
+    # how long a worker may hold the lock while it recomputes a value
+    "LOCK_TIMEOUT": float(os.getenv("CACHE_LOCK_TIMEOUT", 5)),  # seconds
+    # how long the other workers wait for the value before computing it themselves
+    "WAIT_TIMEOUT": float(os.getenv("CACHE_LOCK_WAIT_TIMEOUT", 2)),  # seconds
+    "POLL_INTERVAL": float(os.getenv("CACHE_LOCK_POLL_INTERVAL", 0.05)),  # seconds
+    # how long an expired value is kept to be served while it is recomputed
+    "STALE_EXPIRATION": int(os.getenv("CACHE_STALE_EXPIRATION", 60)),  # seconds
+}
+
+# cached keys longer than this (parameters part) are hashed
+CACHE_KEY_MAX_PARAMS_LENGTH = 200
+
+# the generation of a shop is bumped on every order write, it is part of the key
+# of every cached page, so the pages of the previous generation are not reachable
+# anymore
+ORDERS_CACHE_FAMILY = "orders"
+ORDERS_CACHE_EXPIRATION = 3600  # 1 hour
+# early refresh (XFetch) of the cached pages, 0 disables it
+ORDERS_CACHE_EARLY_REFRESH_BETA = float(os.getenv("ORDERS_CACHE_EARLY_REFRESH_BETA", 0))
+
+# the cached order details are keyed by the version of the order, which is replaced
+# on every change of the order, so the details read before a change are not
+# reachable anymore
+ORDER_DETAILS_CACHE_FAMILY = "order"
+ORDER_DETAILS_CACHE_EXPIRATION = 300  # 5 minutes
+ORDER_DETAILS_VERSION_CACHE_FAMILY = "order-version"
+# outlives the details cached under a version
+ORDER_DETAILS_VERSION_EXPIRATION = 2 * ORDER_DETAILS_CACHE_EXPIRATION
+
+IDEMPOTENCY_CACHE_FAMILY = "idempotency"
+IDEMPOTENCY_CACHE_EXPIRATION = 86400  # 24 hours
+IDEMPOTENCY_IN_PROGRESS_EXPIRATION = 30  # seconds
+
+# real-time order events, published to Redis and streamed to the kitchen and
+# cashier screens of every shop
+ORDER_EVENTS_SETTINGS = {
+    "CHANNEL_PREFIX": "order-events:",
+    # the recent events of every shop, read to resume a stream after a reconnect
+    "STREAM_KEY": "order-events-stream:{coffee_shop_id}",
+    "STREAM_MAX_LENGTH": int(os.getenv("ORDER_EVENTS_STREAM_MAX_LENGTH", 1000)),
+    # a comment is sent on idle streams so proxies do not close them
+    "KEEPALIVE_INTERVAL": float(os.getenv("ORDER_EVENTS_KEEPALIVE_INTERVAL", 15)),
+    # events buffered per subscriber, a slower subscriber is disconnected
+    "SUBSCRIBER_QUEUE_SIZE": int(os.getenv("ORDER_EVENTS_QUEUE_SIZE", 100)),
+}
 
 # gRPC settings
 USER_SERVICE_GRPC_HOST = os.getenv("GRPC_HOST")
 USER_SERVICE_GRPC_PORT = os.getenv("GRPC_PORT")
 USER_SERVICE_GRPC_ADDRESS = f"{USER_SERVICE_GRPC_HOST}:{USER_SERVICE_GRPC_PORT}"
+USER_SERVICE_GRPC_SETTINGS = {
+    "TIMEOUT": float(os.getenv("GRPC_TIMEOUT", 2.0)),  # per-call deadline in seconds
+    # not below the 5 minutes interval of the pings a gRPC server accepts by default
+    "KEEPALIVE_TIME_MS": int(os.getenv("GRPC_KEEPALIVE_TIME_MS", 300000)),
+    "KEEPALIVE_TIMEOUT_MS": int(os.getenv("GRPC_KEEPALIVE_TIMEOUT_MS", 10000)),
+}
+
+# users cache settings (in-process and Redis), the users are looked up by the
+# coffee shop of the requester, so a shop never gets a user found for another one
+USERS_CACHE_FAMILY = "user"
+USERS_CACHE_EXPIRATION = int(os.getenv("USERS_CACHE_EXPIRATION", 600))  # seconds
+# the most recent assigners of a shop loaded when its users cache is pre-warmed
+USERS_CACHE_WARM_LIMIT = int(os.getenv("USERS_CACHE_WARM_LIMIT", 100))
+# queue of the role changes published by the User Service, the changed users are
+# removed from the cache, not consumed if not set
+USER_ROLE_CHANGES_QUEUE = os.getenv("USER_ROLE_CHANGES_QUEUE")
+
+# customers cache settings (in-process)
+CUSTOMERS_CACHE_SIZE = int(os.getenv("CUSTOMERS_CACHE_SIZE", 10000))
+CUSTOMERS_CACHE_EXPIRATION = int(os.getenv("CUSTOMERS_CACHE_EXPIRATION", 600))
 
 
 # docs settings
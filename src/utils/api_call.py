@@ -1,16 +1,104 @@
-import requests
+import asyncio
+import random
+import httpx
 from typing import Any
+from fastapi import status
 from src.exceptions.exception import OrderServiceException
+from src.settings.settings import HTTP_CLIENT_SETTINGS
+from src.utils.circuit_breaker import CircuitBreaker
 
+# the responses of a GET request that are worth retrying
+RETRY_STATUS_CODES = (502, 503, 504)
 
-def send_request(
+# shared client, its pool keeps the connections to the other services alive
+# between the requests
+_client: httpx.AsyncClient = None
+# one circuit breaker per downstream host
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_stats = {"requests": 0, "in_flight": 0, "retries": 0, "failures": 0, "rejected": 0}
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    This function returns the shared HTTP client, it is created on the first call,
+    from the running event loop
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                connect=HTTP_CLIENT_SETTINGS["CONNECT_TIMEOUT"],
+                read=HTTP_CLIENT_SETTINGS["READ_TIMEOUT"],
+                write=HTTP_CLIENT_SETTINGS["READ_TIMEOUT"],
+                pool=HTTP_CLIENT_SETTINGS["POOL_TIMEOUT"],
+            ),
+            limits=httpx.Limits(
+                max_connections=HTTP_CLIENT_SETTINGS["MAX_CONNECTIONS"],
+                max_keepalive_connections=HTTP_CLIENT_SETTINGS[
+                    "MAX_KEEPALIVE_CONNECTIONS"
+                ],
+                keepalive_expiry=HTTP_CLIENT_SETTINGS["KEEPALIVE_EXPIRY"],
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """
+    This function closes the shared HTTP client if it is opened
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+
+
+def _get_circuit_breaker(host: str) -> CircuitBreaker:
+    if host not in _circuit_breakers:
+        _circuit_breakers[host] = CircuitBreaker(
+            failure_threshold=HTTP_CLIENT_SETTINGS["BREAKER_FAILURE_THRESHOLD"],
+            reset_timeout=HTTP_CLIENT_SETTINGS["BREAKER_RESET_TIMEOUT"],
+        )
+    return _circuit_breakers[host]
+
+
+def get_http_client_stats() -> dict:
+    """
+    This function returns the counters of the shared HTTP client, its pool limits and
+    the state of the circuit breaker of every host
+    """
+    return {
+        **_stats,
+        "max_connections": HTTP_CLIENT_SETTINGS["MAX_CONNECTIONS"],
+        "max_keepalive_connections": HTTP_CLIENT_SETTINGS["MAX_KEEPALIVE_CONNECTIONS"],
+        "circuit_breakers": {
+            host: breaker.stats() for host, breaker in _circuit_breakers.items()
+        },
+    }
+
+
+def _error_detail(response: httpx.Response) -> str:
+    # the body may not be a JSON object, e.g. when it comes from a proxy
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    if isinstance(body, dict) and body.get("detail"):
+        return body["detail"]
+    return response.text or response.reason_phrase
+
+
+async def send_request(
     url: str,
     action: str,
     payload: Any,
     auth_token: str,
 ):
     """
-    This function sends a request to a specific URL with a specific action and payload
+    This function sends a request to a specific URL with a specific action and payload,
+    through the shared client. GET requests are retried with a random backoff when
+    they fail or get a 502/503/504, and the requests to a host that keeps failing
+    fail fast until its circuit breaker lets a trial request through
     *Args:
         url (str): the URL to send the request to
         action (str): HTTP method (GET, POST, PUT, PATCH, DELETE)
@@ -22,14 +110,59 @@ def send_request(
         "content-type": "application/json",
         "Authorization": f"Bearer {auth_token}",
     }
-    try:
-        response = requests.request(
-            method=action, url=url, headers=headers, json=payload
+    host = httpx.URL(url).host
+    breaker = _get_circuit_breaker(host)
+    attempts = 1 + (HTTP_CLIENT_SETTINGS["RETRIES"] if action.upper() == "GET" else 0)
+
+    for attempt in range(attempts):
+        if attempt:
+            _stats["retries"] += 1
+            await asyncio.sleep(
+                random.uniform(
+                    0, HTTP_CLIENT_SETTINGS["RETRY_BACKOFF"] * 2 ** (attempt - 1)
+                )
+            )
+        if not breaker.allow_request():
+            _stats["rejected"] += 1
+            raise OrderServiceException(
+                message=f"The service at {host} is unavailable",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        _stats["requests"] += 1
+        _stats["in_flight"] += 1
+        try:
+            response = await _get_http_client().request(
+                method=action, url=url, headers=headers, json=payload
+            )
+            error = None
+        except httpx.TransportError as e:
+            response, error = None, e
+        finally:
+            _stats["in_flight"] -= 1
+
+        if error is not None or response.status_code >= 500:
+            _stats["failures"] += 1
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        if error is None and response.status_code not in RETRY_STATUS_CODES:
+            break
+
+    if error is not None:
+        raise OrderServiceException(
+            message=f"The request to the service at {host} failed: {error!r}",
+            status_code=(
+                status.HTTP_504_GATEWAY_TIMEOUT
+                if isinstance(error, httpx.TimeoutException)
+                else status.HTTP_503_SERVICE_UNAVAILABLE
+            ),
         )
+    try:
         response.raise_for_status()
         return response
-    except requests.exceptions.HTTPError as http_err:
+    except httpx.HTTPStatusError as http_err:
         raise OrderServiceException(
-            message=http_err.response.json().get("detail"),
+            message=_error_detail(http_err.response),
             status_code=http_err.response.status_code,
         )
@@ -0,0 +1,54 @@
+import zlib
+from src.settings.settings import CACHE_COMPRESSION
+
+
+class CacheCodec:
+    """
+    Encodes the cached values, values larger than the threshold are compressed.
+    Every encoded value starts with a marker byte, so the values written with
+    another algorithm or threshold can still be decoded
+    """
+
+    RAW = b"r"
+    ZLIB = b"z"
+
+    def __init__(self, algorithm: str = "zlib", threshold: int = 1024, level: int = 1):
+        if algorithm not in ("none", "zlib"):
+            raise ValueError(f"Unknown cache compression algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.threshold = threshold
+        self.level = level
+
+    def encode(self, value: bytes) -> bytes:
+        """
+        Encode a value before it is written to the cache
+        *Args:
+            value (bytes): the value to encode
+        *Returns:
+            bytes: the encoded value
+        """
+        if self.algorithm == "zlib" and len(value) > self.threshold:
+            return self.ZLIB + zlib.compress(value, self.level)
+        return self.RAW + value
+
+    def decode(self, value: bytes) -> bytes:
+        """
+        Decode a value read from the cache
+        *Args:
+            value (bytes): the encoded value
+        *Returns:
+            bytes: the original value
+        """
+        marker, value = value[:1], value[1:]
+        if marker == self.ZLIB:
+            return zlib.decompress(value)
+        if marker == self.RAW:
+            return value
+        raise ValueError("Unknown cache value encoding")
+
+
+cache_codec = CacheCodec(
+    algorithm=CACHE_COMPRESSION["ALGORITHM"],
+    threshold=CACHE_COMPRESSION["THRESHOLD"],
+    level=CACHE_COMPRESSION["LEVEL"],
+)
@@ -0,0 +1,77 @@
+import asyncio
+from redis import asyncio as redis
+from src.settings.settings import (
+    REDIS,
+    CACHE_INVALIDATION_CHANNEL,
+    CACHE_KEY_INVALIDATION_CHANNEL,
+)
+from src.utils.redis_caching import local_cache
+
+
+class CacheInvalidationListener:
+    """
+    Background task that listens to the cache invalidation channels and removes the
+    invalidated prefixes and keys from the in-process cache tier of this worker. The
+    whole tier is cleared when the subscription is (re)established, as messages may
+    have been missed while it was down
+    """
+
+    def __init__(self, channel: str, keys_channel: str, retry_interval: float = 1.0):
+        self.channel = channel
+        self.keys_channel = keys_channel
+        self.retry_interval = retry_interval
+        self._task = None
+
+    async def _listen(self):
+        client = redis.Redis(
+            host=REDIS["HOST"],
+            password=REDIS["PASSWORD"],
+            port=REDIS["PORT"],
+            db=REDIS["DB"],
+        )
+        try:
+            async with client.pubsub() as pubsub:
+                await pubsub.subscribe(self.channel, self.keys_channel)
+                local_cache.clear()
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    if message["channel"].decode() == self.keys_channel:
+                        local_cache.delete(message["data"].decode())
+                    else:
+                        local_cache.delete_prefix(message["data"].decode())
+        finally:
+            await client.aclose()
+
+    async def _run(self):
+        while True:
+            try:
+                await self._listen()
+            except Exception as e:
+                print(
+                    f"Error while listening to cache invalidations: {e}"
+                )  # Will be replaced with logger
+            # entries may be stale until the subscription is back
+            local_cache.clear()
+            await asyncio.sleep(self.retry_interval)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self._run(), name="cache-invalidation-listener"
+            )
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# process-wide listener, started and stopped by the application lifespan
+cache_invalidation_listener = CacheInvalidationListener(
+    channel=CACHE_INVALIDATION_CHANNEL, keys_channel=CACHE_KEY_INVALIDATION_CHANNEL
+)
@@ -0,0 +1,62 @@
+import hashlib
+from enum import Enum
+from typing import Any
+from urllib.parse import quote
+from src.settings.settings import CACHE_KEY_MAX_PARAMS_LENGTH
+
+
+def _encode(value: Any) -> str:
+    """
+    Encode a key parameter in a canonical form: enums by their value, collections
+    sorted and deduplicated, a missing or empty value as "-" and the separators
+    escaped
+    """
+    if value is None:
+        return "-"
+    if isinstance(value, Enum):
+        return _encode(value.value)
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ",".join(sorted({_encode(item) for item in value})) or "-"
+    return quote(str(value), safe="")
+
+
+def cache_key_prefix(family: str, scope: Any) -> str:
+    """
+    Build the prefix shared by all the keys of a family in a scope (e.g. a coffee
+    shop), used to invalidate them together
+    *Args:
+        family (str): the family of the keys, e.g. "orders"
+        scope (Any): the scope of the keys, e.g. the coffee shop id
+    *Returns:
+        the prefix of the keys
+    """
+    return f"{family}:{_encode(scope)}:"
+
+
+def build_cache_key(family: str, scope: Any, **params: Any) -> str:
+    """
+    Build a canonical cache key, the same parameters give the same key whatever
+    their order or the order of the values of a multi-valued parameter. The
+    parameters part is hashed when it is too long, the prefix is kept as is
+    *Args:
+        family (str): the family of the key, e.g. "orders"
+        scope (Any): the scope of the key, e.g. the coffee shop id
+        params (Any): the parameters that identify the cached value
+    *Returns:
+        the cache key
+    """
+    encoded_params = ":".join(
+        f"{name}={_encode(value)}" for name, value in sorted(params.items())
+    )
+    if len(encoded_params) > CACHE_KEY_MAX_PARAMS_LENGTH:
+        encoded_params = "sha256=" + hashlib.sha256(encoded_params.encode()).hexdigest()
+    return cache_key_prefix(family=family, scope=scope) + encoded_params
+
+
+def cache_key_family(key: str) -> str:
+    """
+    Get the family of a cache key
+    """
+    return key.split(":", 1)[0]
@@ -0,0 +1,45 @@
+import threading
+from collections import Counter, defaultdict
+from src.utils.cache_keys import cache_key_family
+
+
+class CacheStats:
+    """
+    In-process counters of the cache lookups of this worker, grouped by key family
+    """
+
+    EVENTS = ("hits", "local_hits", "stale_hits", "misses", "errors")
+
+    def __init__(self):
+        self._counters: defaultdict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def record(self, key: str, event: str) -> None:
+        """
+        Count a lookup of a key
+        *Args:
+            key (str): the looked up key
+            event (str): one of CacheStats.EVENTS
+        *Returns:
+            None
+        """
+        with self._lock:
+            self._counters[cache_key_family(key)][event] += 1
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        """
+        Get the current counters of every family
+        """
+        with self._lock:
+            return {
+                family: {event: counter[event] for event in self.EVENTS}
+                for family, counter in self._counters.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+# process-wide counters, exposed by the monitoring router
+cache_stats = CacheStats()
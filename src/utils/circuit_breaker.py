@@ -0,0 +1,67 @@
+import time
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of the calls to a downstream service. It opens after
+    failure_threshold consecutive failures and rejects the calls for reset_timeout
+    seconds, then lets one trial call through (half open): a success closes it, a
+    failure opens it again. Another trial is let through if the previous one did not
+    report back within reset_timeout
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_count = 0
+        self._changed_at = time.monotonic()
+
+    def allow_request(self) -> bool:
+        """
+        Check if a call can be sent now
+        *Args:
+            None
+        *Returns:
+            bool: True if the call can be sent, False if it must fail fast
+        """
+        if self.state == self.CLOSED:
+            return True
+        if time.monotonic() - self._changed_at < self.reset_timeout:
+            return False
+        self.state = self.HALF_OPEN
+        self._changed_at = time.monotonic()
+        return True
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            self.state = self.CLOSED
+            self._changed_at = time.monotonic()
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if (
+            self.state == self.HALF_OPEN
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.state != self.OPEN:
+                self.opened_count += 1
+            self.state = self.OPEN
+            self._changed_at = time.monotonic()
+
+    def stats(self) -> dict:
+        """
+        Get the state of the breaker
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened_count": self.opened_count,
+            "seconds_in_state": round(time.monotonic() - self._changed_at, 3),
+        }
@@ -0,0 +1,44 @@
+import asyncio
+from typing import Any, Awaitable
+from fastapi import status
+from src.exceptions import OrderServiceException
+
+
+async def run_concurrently(*awaitables: Awaitable, timeout: float) -> list[Any]:
+    """
+    Run independent awaitables concurrently and wait for all of them. When one of
+    them fails or the deadline passes, the others are cancelled
+    *Args:
+        awaitables (Awaitable): the independent steps to run
+        timeout (float): the deadline in seconds for all the steps
+    *Returns:
+        the results of the steps in the same order, raise the first error of the
+        failed step or OrderServiceException if the deadline passes
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        done, pending = await asyncio.wait(
+            tasks, timeout=timeout, return_when=asyncio.FIRST_EXCEPTION
+        )
+    except BaseException:
+        # the caller was cancelled, do not leave the steps running
+        await _cancel(tasks)
+        raise
+
+    failed = [task for task in done if task.exception() is not None]
+    if pending or failed:
+        await _cancel(pending)
+    if failed:
+        raise failed[0].exception()
+    if pending:
+        raise OrderServiceException(
+            message="The request took too long to be processed",
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        )
+    return [task.result() for task in tasks]
+
+
+async def _cancel(tasks) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,207 @@
+import asyncio
+import json
+from collections import defaultdict
+from typing import AsyncIterator, Optional
+from redis import asyncio as redis
+from src.data.order_event import OrderEvent
+from src.settings.settings import REDIS, ORDER_EVENTS_SETTINGS
+from src.utils.redis_caching import connection_pool
+
+# appends an event to the stream of its shop and publishes it with its entry id
+# to the channel of the shop, atomically so both see the events in the same order
+PUBLISH_EVENT_SCRIPT = """
+local event_id = redis.call("xadd", KEYS[1], "maxlen", "~", ARGV[1], "*", "event", ARGV[2])
+redis.call("publish", KEYS[2], event_id .. "|" .. ARGV[2])
+return event_id
+"""
+
+
+def stream_position(event_id: str) -> tuple[int, int]:
+    """
+    Get the position of an event in the stream of its shop from its id
+    ("<milliseconds>-<sequence>"), raise ValueError if the id is not valid
+    """
+    milliseconds, sequence = event_id.split("-")
+    return int(milliseconds), int(sequence)
+
+
+class OrderEventsBroker:
+    """
+    Publishes the order events of every coffee shop to Redis and streams them to the
+    subscribers of this worker. Every event is appended to the capped stream of its
+    shop, the entry id is the id of the event, and published to the channel of the
+    shop; one pattern subscription per worker fans the events out to its local
+    subscribers. A subscriber resumes after its last seen event by reading the stream
+    """
+
+    def __init__(
+        self,
+        channel_prefix: str,
+        stream_key: str,
+        stream_max_length: int,
+        keepalive_interval: float,
+        queue_size: int,
+        retry_interval: float = 1.0,
+    ):
+        self.channel_prefix = channel_prefix
+        self.stream_key = stream_key
+        self.stream_max_length = stream_max_length
+        self.keepalive_interval = keepalive_interval
+        self.queue_size = queue_size
+        self.retry_interval = retry_interval
+        self._subscribers: defaultdict[int, set[asyncio.Queue]] = defaultdict(set)
+        self._task = None
+
+    async def publish(self, events: list[OrderEvent]) -> None:
+        """
+        Publish events to the subscribers of their shops in every worker, in one
+        round-trip (pipeline)
+        *Args:
+            events (list[OrderEvent]): the events to publish
+        *Returns:
+            None, the event_id of every event is set
+        """
+        client = redis.Redis(connection_pool=connection_pool)
+        async with client.pipeline(transaction=False) as pipeline:
+            for event in events:
+                pipeline.eval(
+                    PUBLISH_EVENT_SCRIPT,
+                    2,
+                    self.stream_key.format(coffee_shop_id=event.coffee_shop_id),
+                    f"{self.channel_prefix}{event.coffee_shop_id}",
+                    self.stream_max_length,
+                    json.dumps(event.to_dict()),
+                )
+            event_ids = await pipeline.execute()
+        for event, event_id in zip(events, event_ids):
+            event.event_id = event_id.decode()
+
+    async def subscribe(
+        self, coffee_shop_id: int, last_event_id: Optional[str] = None
+    ) -> AsyncIterator[Optional[OrderEvent]]:
+        """
+        Stream the events of a coffee shop as they are published, the kept events
+        published after last_event_id are streamed first. None is streamed when no
+        event was published for keepalive_interval seconds. The stream ends when the
+        subscriber falls too far behind or the subscription of the worker is lost,
+        the client resumes it with its last seen event id
+        *Args:
+            coffee_shop_id (int): id of the coffee shop of the events
+            last_event_id (Optional[str]): id of the last event seen by the client
+        *Returns:
+            an async iterator of the events
+        """
+        # registered before reading the stream, so no event is missed in between
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[coffee_shop_id].add(queue)
+        try:
+            last_position = None
+            if last_event_id:
+                last_position = stream_position(last_event_id)
+                client = redis.Redis(connection_pool=connection_pool)
+                entries = await client.xrange(
+                    self.stream_key.format(coffee_shop_id=coffee_shop_id),
+                    min=f"({last_event_id}",
+                    max="+",
+                )
+                for entry_id, fields in entries:
+                    event = OrderEvent.from_dict(
+                        json.loads(fields[b"event"]), event_id=entry_id.decode()
+                    )
+                    last_position = stream_position(event.event_id)
+                    yield event
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=self.keepalive_interval
+                    )
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event is None:
+                    return
+                if last_position and stream_position(event.event_id) <= last_position:
+                    # already streamed from the stream of the shop
+                    continue
+                yield event
+        finally:
+            self._subscribers[coffee_shop_id].discard(queue)
+            if not self._subscribers[coffee_shop_id]:
+                del self._subscribers[coffee_shop_id]
+
+    def _dispatch(self, message: bytes) -> None:
+        event_id, event = message.decode().split("|", 1)
+        event = OrderEvent.from_dict(json.loads(event), event_id=event_id)
+        for queue in list(self._subscribers.get(event.coffee_shop_id, ())):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # too slow, it resumes from the stream of the shop after reconnecting
+                self._subscribers[event.coffee_shop_id].discard(queue)
+                self._end_stream(queue)
+
+    @staticmethod
+    def _end_stream(queue: asyncio.Queue) -> None:
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def _end_all_streams(self) -> None:
+        for queues in self._subscribers.values():
+            for queue in queues:
+                self._end_stream(queue)
+        self._subscribers.clear()
+
+    async def _listen(self):
+        client = redis.Redis(
+            host=REDIS["HOST"],
+            password=REDIS["PASSWORD"],
+            port=REDIS["PORT"],
+            db=REDIS["DB"],
+        )
+        try:
+            async with client.pubsub() as pubsub:
+                await pubsub.psubscribe(f"{self.channel_prefix}*")
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self._dispatch(message["data"])
+        finally:
+            await client.aclose()
+
+    async def _run(self):
+        while True:
+            try:
+                await self._listen()
+            except Exception as e:
+                print(
+                    f"Error while listening to order events: {e}"
+                )  # Will be replaced with logger
+            # events may be missed until the subscription is back, the clients
+            # resume their streams from the stream of their shop
+            self._end_all_streams()
+            await asyncio.sleep(self.retry_interval)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="order-events-listener")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._end_all_streams()
+
+
+# process-wide broker, its listener is started and stopped by the application lifespan
+order_events_broker = OrderEventsBroker(
+    channel_prefix=ORDER_EVENTS_SETTINGS["CHANNEL_PREFIX"],
+    stream_key=ORDER_EVENTS_SETTINGS["STREAM_KEY"],
+    stream_max_length=ORDER_EVENTS_SETTINGS["STREAM_MAX_LENGTH"],
+    keepalive_interval=ORDER_EVENTS_SETTINGS["KEEPALIVE_INTERVAL"],
+    queue_size=ORDER_EVENTS_SETTINGS["SUBSCRIBER_QUEUE_SIZE"],
+)
@@ -0,0 +1,67 @@
+import asyncio
+from src.helpers.outbox import relay_order_notifications
+from src.settings.database import SessionLocal
+from src.settings.settings import OUTBOX_RELAY_SETTINGS
+
+
+class OutboxRelay:
+    """
+    Background task that drains the order outbox to RabbitMQ in batches.
+    It polls the outbox every interval, or immediately when it is woken up
+    after an order is committed
+    """
+
+    def __init__(self, batch_size: int, interval: float):
+        self.batch_size = batch_size
+        self.interval = interval
+        self._wakeup = None
+        self._task = None
+
+    async def _relay_pending(self) -> int:
+        async with SessionLocal() as db:
+            return await relay_order_notifications(db=db, batch_size=self.batch_size)
+
+    async def _run(self):
+        while True:
+            try:
+                relayed = await self._relay_pending()
+            except Exception as e:
+                relayed = 0
+                print(
+                    f"Error while relaying outbox: {e}"
+                )  # Will be replaced with logger
+            # keep draining while full batches are found
+            if relayed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    def wake(self):
+        """
+        Ask the relay to drain the outbox without waiting for the next poll
+        """
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="order-outbox-relay")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# process-wide relay, started and stopped by the application lifespan
+outbox_relay = OutboxRelay(
+    batch_size=OUTBOX_RELAY_SETTINGS["BATCH_SIZE"],
+    interval=OUTBOX_RELAY_SETTINGS["INTERVAL"],
+)
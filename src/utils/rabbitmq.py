@@ -1,30 +1,122 @@
-import pika
+import asyncio
+import aio_pika
+from typing import Optional
+from aio_pika.abc import AbstractRobustChannel, AbstractRobustConnection
+from src.settings.settings import (
+    RABBITMQ_HOST,
+    RABBITMQ_USER,
+    RABBITMQ_PASSWORD,
+)
 
 
 class RabbitMQClient:
-    def __init__(self, host="localhost", username="guest", password="guest"):
+    """
+    Long-lived RabbitMQ publisher, keeps one robust connection and one channel open
+    and reuses them for all the published messages. The connection and the channel
+    are re-opened automatically by aio-pika if the broker drops them, and queues are
+    declared only once. The channel uses publisher confirms, so a publish returns
+    only once the broker has taken the messages.
+    """
+
+    def __init__(
+        self,
+        host="localhost",
+        username="guest",
+        password="guest",
+        publisher_confirms: bool = True,
+    ):
         self.host = host
-        self.credentials = pika.PlainCredentials(username, password)
-        self.connection = None
-        self.channel = None
+        self.username = username
+        self.password = password
+        self.publisher_confirms = publisher_confirms
+        self.connection: AbstractRobustConnection = None
+        self.channel: AbstractRobustChannel = None
+        self._declared_queues = set()
+        self._lock = asyncio.Lock()
 
-    def _connect(self):
+    async def _connect(self):
         if self.connection is None or self.connection.is_closed:
-            self.connection = pika.BlockingConnection(
-                pika.ConnectionParameters(host=self.host, credentials=self.credentials)
+            self.connection = await aio_pika.connect_robust(
+                host=self.host, login=self.username, password=self.password
+            )
+            self.channel = await self.connection.channel(
+                publisher_confirms=self.publisher_confirms
+            )
+            self._declared_queues.clear()
+
+    async def connect(self):
+        """
+        Open the connection and the channel if they are not opened yet
+        """
+        async with self._lock:
+            await self._connect()
+            return self.channel
+
+    async def _declare_queue(self, queue_name: str):
+        if queue_name not in self._declared_queues:
+            async with self._lock:
+                if queue_name not in self._declared_queues:
+                    await self.channel.declare_queue(queue_name, durable=True)
+                    self._declared_queues.add(queue_name)
+
+    async def publish_messages(
+        self,
+        queue_name: str,
+        messages: list[str],
+        message_ids: Optional[list[str]] = None,
+    ):
+        """
+        Publish a batch of messages to a queue over the shared channel. When
+        publisher confirms are enabled, all the messages are sent first and their
+        confirmations are awaited together
+        *Args:
+            queue_name (str): the name of the queue to publish to
+            messages (list[str]): the messages to publish
+            message_ids (Optional[list[str]]): the message id of each message, used
+                by the consumers to drop the duplicates
+        *Returns:
+            None
+        """
+        if message_ids is None:
+            message_ids = [None] * len(messages)
+        channel = await self.connect()
+        await self._declare_queue(queue_name)
+        await asyncio.gather(
+            *(
+                channel.default_exchange.publish(
+                    aio_pika.Message(
+                        body=message.encode(),
+                        message_id=message_id,
+                        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                    ),
+                    routing_key=queue_name,  # default nameless exchange
+                )
+                for message, message_id in zip(messages, message_ids)
             )
-            self.channel = self.connection.channel()
-
-    def publish_message(self, queue_name: str, message: str):
-        self._connect()
-        self.channel.queue_declare(queue=queue_name, durable=True)
-        self.channel.basic_publish(
-            exchange="",
-            routing_key=queue_name,  # default nameless exchange
-            body=message,
-            properties=pika.BasicProperties(delivery_mode=2),
         )
 
-    def close(self):
-        if self.connection is not None and not self.connection.is_closed:
-            self.connection.close()
+    async def publish_message(self, queue_name: str, message: str):
+        """
+        Publish a single message to a queue over the shared channel
+        *Args:
+            queue_name (str): the name of the queue to publish to
+            message (str): the message to publish
+        *Returns:
+            None
+        """
+        await self.publish_messages(queue_name=queue_name, messages=[message])
+
+    async def close(self):
+        async with self._lock:
+            if self.connection is not None and not self.connection.is_closed:
+                await self.connection.close()
+            self.connection = None
+            self.channel = None
+
+
+# process-wide publisher, opened and closed by the application lifespan
+rabbitmq_client = RabbitMQClient(
+    host=RABBITMQ_HOST,
+    username=RABBITMQ_USER,
+    password=RABBITMQ_PASSWORD,
+)
@@ -1,17 +1,61 @@
-import redis
-from src.settings.settings import REDIS
+import asyncio
+import math
+import random
+import time
+import uuid
+import zlib
+from typing import Awaitable, Callable, Optional, Union
+from redis import asyncio as redis
+from redis.exceptions import RedisError
+from src.settings.settings import (
+    REDIS,
+    LOCAL_CACHE_SETTINGS,
+    CACHE_INVALIDATION_CHANNEL,
+    CACHE_KEY_INVALIDATION_CHANNEL,
+    CACHE_LOCK_SETTINGS,
+)
+from src.utils.ttl_cache import TTLCache
+from src.utils.cache_codec import cache_codec
+from src.utils.cache_stats import cache_stats
+
+# process-wide connection pool, shared by all the cache managers, a request waits
+# up to POOL_TIMEOUT for a free connection when all of them are in use
+connection_pool = redis.BlockingConnectionPool(
+    host=REDIS["HOST"],
+    password=REDIS["PASSWORD"],
+    port=REDIS["PORT"],
+    db=REDIS["DB"],
+    max_connections=REDIS["MAX_CONNECTIONS"],
+    timeout=REDIS["POOL_TIMEOUT"],
+    socket_timeout=REDIS["SOCKET_TIMEOUT"],
+    socket_connect_timeout=REDIS["SOCKET_CONNECT_TIMEOUT"],
+)
+
+# process-wide in-process tier, holds the values as returned by Redis
+local_cache = TTLCache(
+    maxsize=LOCAL_CACHE_SETTINGS["SIZE"], ttl=LOCAL_CACHE_SETTINGS["EXPIRATION"]
+)
+
+# deletes a lock only if it is still held by the same owner
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
 
 
 class CacheManager:
-    def __init__(self):
-        self.cache = redis.Redis(
-            host=REDIS["HOST"],
-            password=REDIS["PASSWORD"],
-            port=REDIS["PORT"],
-            db=REDIS["DB"],
-        )
+    def __init__(self, use_local_cache: bool = False):
+        """
+        *Args:
+            use_local_cache (bool): check the in-process tier before Redis and keep
+                the read and written values in it
+        """
+        self.cache = redis.Redis(connection_pool=connection_pool)
+        self.use_local_cache = use_local_cache and LOCAL_CACHE_SETTINGS["ENABLED"]
 
-    def set_cache(self, key: str, value: str, expire: int) -> None:
+    async def set_cache(self, key: str, value: str, expire: int) -> None:
         """
         Set a key-value pair in the cache with an expiration time
         *Args:
@@ -21,9 +65,49 @@ class CacheManager:
         *Returns:
             None
         """
-        self.cache.set(key, value, ex=expire)
+        await self.cache.set(key, value, ex=expire)
+        if self.use_local_cache:
+            local_cache.set(
+                key,
+                value.encode() if isinstance(value, str) else value,
+                ttl=min(expire, local_cache.ttl),
+            )
+
+    async def set_cache_if_not_exists(self, key: str, value: str, expire: int) -> bool:
+        """
+        Set a key-value pair in the cache with an expiration time, only if the key
+        does not exist yet
+        *Args:
+            key (str): The key to set in the cache
+            value (str): The value to set in the cache
+            expire (int): The expiration time in seconds
+        *Returns:
+            bool: True if the key was set, False if it already exists
+        """
+        return bool(await self.cache.set(key, value, ex=expire, nx=True))
+
+    async def delete_cache(self, key: str) -> None:
+        """
+        Delete a key from the cache
+        *Args:
+            key (str): The key to delete from the cache
+        *Returns:
+            None
+        """
+        local_cache.delete(key)
+        await self.cache.delete(key)
+
+    async def increment(self, key: str) -> int:
+        """
+        Increment the integer value of a key by one, a missing key starts from 0
+        *Args:
+            key (str): The key to increment
+        *Returns:
+            int: The value of the key after the increment
+        """
+        return await self.cache.incr(key)
 
-    def get_cache(self, key: str) -> str:
+    async def get_cache(self, key: str) -> Optional[bytes]:
         """
         Get the value of a key from the cache
         *Args:
@@ -31,4 +115,266 @@ class CacheManager:
         *Returns:
             str: The value of the key
         """
-        return self.cache.get(key)
+        value, _ = await self._read(key)
+        return value
+
+    async def _read(self, key: str) -> tuple[Optional[bytes], bool]:
+        # returns the value and whether it was found in the in-process tier
+        if self.use_local_cache:
+            value = local_cache.get(key)
+            if value is not None:
+                return value, True
+        value = await self.cache.get(key)
+        if self.use_local_cache and value is not None:
+            local_cache.set(key, value)
+        return value, False
+
+    async def get_many(self, keys: list[str]) -> list[Optional[bytes]]:
+        """
+        Get the values of many keys from the cache in one round-trip (MGET), every
+        lookup is counted in cache_stats under the family of the key
+        *Args:
+            keys (list[str]): The keys to get from the cache
+        *Returns:
+            list[Optional[bytes]]: The values of the keys in the same order,
+            None for the missing keys
+        """
+        values = {}
+        if self.use_local_cache:
+            for key in keys:
+                value = local_cache.get(key)
+                if value is not None:
+                    values[key] = value
+                    cache_stats.record(key, "local_hits")
+        missing_keys = [key for key in keys if key not in values]
+        if missing_keys:
+            for key, value in zip(missing_keys, await self.cache.mget(missing_keys)):
+                values[key] = value
+                cache_stats.record(key, "misses" if value is None else "hits")
+                if self.use_local_cache and value is not None:
+                    local_cache.set(key, value)
+        return [values[key] for key in keys]
+
+    async def set_many(self, mapping: dict[str, str], expire: int) -> None:
+        """
+        Set many key-value pairs in the cache with an expiration time in one
+        round-trip (pipeline)
+        *Args:
+            mapping (dict[str, str]): The key-value pairs to set in the cache
+            expire (int): The expiration time in seconds
+        *Returns:
+            None
+        """
+        async with self.cache.pipeline(transaction=False) as pipeline:
+            for key, value in mapping.items():
+                pipeline.set(key, value, ex=expire)
+            await pipeline.execute()
+        if self.use_local_cache:
+            for key, value in mapping.items():
+                local_cache.set(
+                    key,
+                    value.encode() if isinstance(value, str) else value,
+                    ttl=min(expire, local_cache.ttl),
+                )
+
+    async def replace_many(self, mapping: dict[str, str], expire: int) -> None:
+        """
+        Set many key-value pairs in the cache with an expiration time and remove
+        their previous values from the in-process tier of every worker, in one
+        round-trip (pipeline)
+        *Args:
+            mapping (dict[str, str]): The key-value pairs to set in the cache
+            expire (int): The expiration time in seconds
+        *Returns:
+            None
+        """
+        for key in mapping:
+            local_cache.delete(key)
+        async with self.cache.pipeline(transaction=False) as pipeline:
+            for key, value in mapping.items():
+                pipeline.set(key, value, ex=expire)
+                pipeline.publish(CACHE_KEY_INVALIDATION_CHANNEL, key)
+            await pipeline.execute()
+
+    async def _get_entry(self, key: str) -> Optional[tuple[float, float, bytes, bool]]:
+        entry, from_local_cache = await self._read(key)
+        if entry is None:
+            return None
+        try:
+            expires_at, compute_time, value = entry.split(b"|", 2)
+            return (
+                float(expires_at),
+                float(compute_time),
+                cache_codec.decode(value),
+                from_local_cache,
+            )
+        except (ValueError, zlib.error):
+            # not written by get_or_compute, computed again
+            return None
+
+    async def _set_entry(
+        self,
+        key: str,
+        value: bytes,
+        expire: int,
+        stale_expire: int,
+        compute_time: float,
+    ) -> None:
+        # the entry is kept stale_expire seconds after its expiry, to be served
+        # while a single worker recomputes it
+        expires_at = time.time() + expire
+        await self.set_cache(
+            key,
+            b"%.3f|%.6f|" % (expires_at, compute_time) + cache_codec.encode(value),
+            expire=expire + stale_expire,
+        )
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Union[str, bytes]]],
+        expire: int,
+        stale_expire: int = CACHE_LOCK_SETTINGS["STALE_EXPIRATION"],
+        early_refresh_beta: float = 0,
+    ) -> bytes:
+        """
+        Get the value of a key from the cache, computing and caching it on a miss.
+        Only one worker computes an expired or missing value at a time (short Redis
+        lock), the others get the expired value if it is still kept, or wait for
+        the computed one. The value can be refreshed before its expiry with a
+        probability that grows as the expiry gets closer (XFetch). Every lookup is
+        counted in cache_stats under the family of the key
+        *Args:
+            key (str): The key of the value in the cache
+            compute (Callable[[], Awaitable[Union[str, bytes]]]): computes the value
+            expire (int): The expiration time in seconds
+            stale_expire (int): How long the expired value is kept to be served
+                while it is recomputed, in seconds
+            early_refresh_beta (float): How early the value may be refreshed,
+                0 disables the early refresh, 1 is the usual value
+        *Returns:
+            bytes: The cached or computed value
+        """
+        try:
+            entry = await self._get_entry(key)
+        except RedisError as e:
+            print(
+                f"Error while reading from cache: {e}"
+            )  # Will be replaced with logger
+            cache_stats.record(key, "errors")
+            return _to_bytes(await compute())
+
+        if entry is not None:
+            expires_at, compute_time, value, from_local_cache = entry
+            refresh_at = expires_at
+            if early_refresh_beta:
+                # XFetch: refresh earlier for values that take long to compute
+                refresh_at += (
+                    compute_time * early_refresh_beta * math.log(1 - random.random())
+                )
+            if time.time() < refresh_at:
+                print(f"Cache hit for key {key}")  # Will be replaced with logger
+                cache_stats.record(key, "local_hits" if from_local_cache else "hits")
+                return value
+        print(f"Cache miss for key {key}")  # Will be replaced with logger
+
+        lock_key, lock_token = f"{key}:lock", uuid.uuid4().hex
+        try:
+            locked = await self.cache.set(
+                lock_key,
+                lock_token,
+                px=int(CACHE_LOCK_SETTINGS["LOCK_TIMEOUT"] * 1000),
+                nx=True,
+            )
+        except RedisError as e:
+            print(f"Error while locking cache key: {e}")  # Will be replaced with logger
+            cache_stats.record(key, "errors")
+            return _to_bytes(await compute())
+
+        if locked:
+            cache_stats.record(key, "misses")
+            try:
+                started_at = time.monotonic()
+                value = _to_bytes(await compute())
+                try:
+                    await self._set_entry(
+                        key,
+                        value,
+                        expire=expire,
+                        stale_expire=stale_expire,
+                        compute_time=time.monotonic() - started_at,
+                    )
+                except RedisError as e:
+                    # the value is served even if it can not be cached
+                    print(
+                        f"Error while writing to cache: {e}"
+                    )  # Will be replaced with logger
+                    cache_stats.record(key, "errors")
+                return value
+            finally:
+                try:
+                    await self.cache.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, lock_token)
+                except RedisError as e:
+                    print(
+                        f"Error while unlocking cache key: {e}"
+                    )  # Will be replaced with logger
+
+        if entry is not None:
+            # another worker is recomputing it
+            cache_stats.record(key, "stale_hits")
+            return entry[2]
+
+        # wait for the worker that computes the value
+        deadline = time.monotonic() + CACHE_LOCK_SETTINGS["WAIT_TIMEOUT"]
+        while time.monotonic() < deadline:
+            await asyncio.sleep(CACHE_LOCK_SETTINGS["POLL_INTERVAL"])
+            try:
+                entry = await self._get_entry(key)
+            except RedisError:
+                break
+            if entry is not None:
+                cache_stats.record(key, "hits")
+                return entry[2]
+        cache_stats.record(key, "misses")
+        return _to_bytes(await compute())
+
+    async def invalidate(self, prefix: str) -> None:
+        """
+        Remove the keys that start with a prefix from the in-process tier of
+        every worker, by publishing the prefix to the invalidation channel
+        *Args:
+            prefix (str): The prefix of the keys to invalidate
+        *Returns:
+            None
+        """
+        local_cache.delete_prefix(prefix)
+        await self.cache.publish(CACHE_INVALIDATION_CHANNEL, prefix)
+
+    async def invalidate_keys(self, keys: list[str]) -> None:
+        """
+        Delete keys from the cache and from the in-process tier of every worker,
+        in one round-trip (pipeline)
+        *Args:
+            keys (list[str]): The keys to invalidate
+        *Returns:
+            None
+        """
+        for key in keys:
+            local_cache.delete(key)
+        async with self.cache.pipeline(transaction=False) as pipeline:
+            pipeline.delete(*keys)
+            for key in keys:
+                pipeline.publish(CACHE_KEY_INVALIDATION_CHANNEL, key)
+            await pipeline.execute()
+
+
+def _to_bytes(value: Union[str, bytes]) -> bytes:
+    return value.encode() if isinstance(value, str) else value
+
+
+async def close_cache_connection_pool() -> None:
+    """
+    Close all the connections of the shared pool, called when the application
+    shuts down
+    """
+    await connection_pool.disconnect()
@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded in-process cache. Entries expire after their TTL and
+    the least recently used entries are evicted once the cache is full
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get the value of a key from the cache
+        *Args:
+            key (Hashable): The key to get from the cache
+            default (Any): The value to return if the key is missing or expired
+        *Returns:
+            The value of the key if it exists and is not expired, default otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Set a key-value pair in the cache, evicting the least recently used
+        entry if the cache is full
+        *Args:
+            key (Hashable): The key to set in the cache
+            value (Any): The value to set in the cache
+            ttl (Optional[float]): The expiration time in seconds, defaults to the cache TTL
+        *Returns:
+            None
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove a key from the cache if it exists
+        *Args:
+            key (Hashable): The key to remove from the cache
+        *Returns:
+            None
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Remove all the string keys that start with a prefix
+        *Args:
+            prefix (str): The prefix of the keys to remove from the cache
+        *Returns:
+            None
+        """
+        with self._lock:
+            for key in [
+                key
+                for key in self._entries
+                if isinstance(key, str) and key.startswith(prefix)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,90 @@
+import asyncio
+import json
+from aio_pika.abc import AbstractIncomingMessage
+from src.helpers.user import _invalidate_user_cache
+from src.settings.settings import USER_ROLE_CHANGES_QUEUE
+from src.utils.rabbitmq import rabbitmq_client
+
+
+class UserRoleChangesConsumer:
+    """
+    Consumes the role changes published by the User Service and removes the changed
+    users from the users cache of every worker. A change is a JSON message with the
+    user_id and the coffee_shop_id of the user. Once consuming, the robust channel
+    restores the consumer by itself when the broker connection is re-opened
+    """
+
+    def __init__(self, queue_name: str, retry_interval: float = 5.0):
+        self.queue_name = queue_name
+        self.retry_interval = retry_interval
+        self._task = None
+        self._queue = None
+        self._consumer_tag = None
+
+    async def _handle(self, message: AbstractIncomingMessage):
+        # a change that can not be applied is requeued, so a changed user is never
+        # left in the cache until it expires
+        async with message.process(requeue=True):
+            try:
+                change = json.loads(message.body)
+                user_id = int(change["user_id"])
+                coffee_shop_id = int(change["coffee_shop_id"])
+            except (ValueError, KeyError, TypeError) as e:
+                print(
+                    f"Invalid user role change message: {e}"
+                )  # Will be replaced with logger
+                return
+            try:
+                await _invalidate_user_cache(
+                    user_id=user_id, coffee_shop_id=coffee_shop_id
+                )
+            except Exception as e:
+                print(
+                    f"Error while applying user role change: {e}"
+                )  # Will be replaced with logger
+                # do not redeliver it right away while the cache is unavailable
+                await asyncio.sleep(self.retry_interval)
+                raise
+
+    async def _run(self):
+        while True:
+            try:
+                channel = await rabbitmq_client.connect()
+                self._queue = await channel.declare_queue(self.queue_name, durable=True)
+                self._consumer_tag = await self._queue.consume(self._handle)
+                return
+            except Exception as e:
+                print(
+                    f"Error while consuming user role changes: {e}"
+                )  # Will be replaced with logger
+                await asyncio.sleep(self.retry_interval)
+
+    def start(self):
+        if not self.queue_name:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self._run(), name="user-role-changes-consumer"
+            )
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._consumer_tag is not None:
+            try:
+                await self._queue.cancel(self._consumer_tag)
+            except Exception as e:
+                print(
+                    f"Error while stopping user role changes consumer: {e}"
+                )  # Will be replaced with logger
+            self._queue = None
+            self._consumer_tag = None
+
+
+# process-wide consumer, started and stopped by the application lifespan
+user_role_changes_consumer = UserRoleChangesConsumer(queue_name=USER_ROLE_CHANGES_QUEUE)